@@ -16,6 +16,7 @@ class ScannerConfig:
     signal_cooldown_hours: float = 2.0
     signal_expiry_hours: float = 4.0
     max_concurrent_fetches: int = 10
+    max_concurrent_analyses: int = 8
     price_fetch_timeout: float = 10.0
     price_fetch_retries: int = 3
     cache_ttl_seconds: int = 60
@@ -44,6 +45,9 @@ class GeminiConfig:
     enabled: bool = bool(os.environ.get("GOOGLE_API_KEY"))
     model: str = "gemini-1.5-flash"
     timeout: float = 30.0
+    max_concurrent_requests: int = 8
+    cache_size: int = 512
+    cache_ttl_seconds: float = 600.0
 
 
 scanner_config = ScannerConfig()
@@ -11,7 +11,9 @@ from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 import threading
 
-from .types import Candle, MultiTimeframeData, PriceResult
+import numpy as np
+
+from .types import MultiTimeframeData, PriceResult, TimeframeArrays
 from .instruments import Instrument
 from .config import scanner_config
 from .logging_config import get_logger
@@ -126,6 +128,8 @@ class DataFetcher:
         self.price_cache = DataCache(default_ttl=30.0)
         self.candle_cache = DataCache(default_ttl=scanner_config.cache_ttl_seconds)
         self._executor = ThreadPoolExecutor(max_workers=scanner_config.max_concurrent_fetches)
+        self._coingecko = None
+        self._coingecko_lock = threading.Lock()
     
     async def get_price(
         self, 
@@ -186,11 +190,31 @@ class DataFetcher:
             logger.error(f"Price fetch error for {symbol}: {e}")
             return None
     
+    def _coingecko_client(self):
+        """
+        Shared CoinGecko client, created on first use. Its requests session is
+        pooled for the executor's threads so TCP/TLS connections are reused.
+        """
+        with self._coingecko_lock:
+            if self._coingecko is None:
+                from pycoingecko import CoinGeckoAPI
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                cg = CoinGeckoAPI()
+                cg.session.mount("https://", HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=3, backoff_factor=0.3,
+                                      status_forcelist=[429, 502, 503, 504])
+                ))
+                self._coingecko = cg
+            return self._coingecko
+    
     def _fetch_crypto_price(self, symbol: str) -> Optional[PriceResult]:
         """Fetch crypto price from CoinGecko."""
         try:
-            from pycoingecko import CoinGeckoAPI
-            cg = CoinGeckoAPI()
+            cg = self._coingecko_client()
             
             coin_map = {
                 "BTC/USD": "bitcoin",
@@ -375,8 +399,8 @@ class DataFetcher:
         mtf = MultiTimeframeData()
         
         # (tf_name, yf_period, yf_interval, max_candles)
-        # max_candles caps each list after any aggregation so we don't hold
-        # thousands of Candle objects per symbol × 62 symbols in memory.
+        # max_candles caps each series after any aggregation so we don't hold
+        # thousands of bars per symbol × 62 symbols in memory.
         # m1 is the worst offender: "1d" at 1-min = up to 1 440 raw bars.
         timeframe_configs = [
             ("d1",  "1mo", "1d",  100),
@@ -392,17 +416,7 @@ class DataFetcher:
             try:
                 hist = ticker.history(period=period, interval=interval)
                 if not hist.empty:
-                    candles = []
-                    for idx, row in hist.iterrows():
-                        candle = Candle(
-                            timestamp=int(idx.timestamp() * 1000),
-                            open=float(row["Open"]),
-                            high=float(row["High"]),
-                            low=float(row["Low"]),
-                            close=float(row["Close"]),
-                            volume=float(row.get("Volume", 0))
-                        )
-                        candles.append(candle)
+                    candles = self._history_to_arrays(hist)
 
                     if tf_name == "h4":
                         candles = self._aggregate_to_h4(candles)
@@ -417,47 +431,59 @@ class DataFetcher:
             except Exception as e:
                 logger.warning(f"Failed to fetch {tf_name} for {symbol}: {e}")
         
-        mtf.h2 = self._aggregate_to_h2(mtf.h1) if mtf.h1 else []
-        mtf.m3 = self._aggregate_to_m3(mtf.m1) if mtf.m1 else []
+        mtf.h2 = self._aggregate_to_h2(mtf.h1)
+        mtf.m3 = self._aggregate_to_m3(mtf.m1)
         
         return mtf
     
-    def _aggregate_to_h4(self, h1_candles: List[Candle]) -> List[Candle]:
+    def _history_to_arrays(self, hist) -> TimeframeArrays:
+        """Pack a yfinance history DataFrame straight into columns."""
+        volume = (
+            hist["Volume"].to_numpy(dtype=np.float64)
+            if "Volume" in hist.columns
+            else None
+        )
+        return TimeframeArrays(
+            timestamp=hist.index.as_unit("ms").asi8,
+            open=hist["Open"].to_numpy(dtype=np.float64),
+            high=hist["High"].to_numpy(dtype=np.float64),
+            low=hist["Low"].to_numpy(dtype=np.float64),
+            close=hist["Close"].to_numpy(dtype=np.float64),
+            volume=volume
+        )
+    
+    def _aggregate_to_h4(self, h1_candles: TimeframeArrays) -> TimeframeArrays:
         """Aggregate 1H candles to 4H."""
         return self._aggregate_candles(h1_candles, 4)
     
-    def _aggregate_to_h2(self, h1_candles: List[Candle]) -> List[Candle]:
+    def _aggregate_to_h2(self, h1_candles: TimeframeArrays) -> TimeframeArrays:
         """Aggregate 1H candles to 2H."""
         return self._aggregate_candles(h1_candles, 2)
     
-    def _aggregate_to_m3(self, m1_candles: List[Candle]) -> List[Candle]:
+    def _aggregate_to_m3(self, m1_candles: TimeframeArrays) -> TimeframeArrays:
         """Aggregate 1M candles to 3M."""
         return self._aggregate_candles(m1_candles, 3)
     
     def _aggregate_candles(
         self, 
-        candles: List[Candle], 
+        candles: TimeframeArrays, 
         period: int
-    ) -> List[Candle]:
+    ) -> TimeframeArrays:
         """Aggregate candles into larger timeframe."""
-        if not candles:
-            return []
-        
-        aggregated = []
-        for i in range(0, len(candles), period):
-            chunk = candles[i:i + period]
-            if chunk:
-                agg = Candle(
-                    timestamp=chunk[0].timestamp,
-                    open=chunk[0].open,
-                    high=max(c.high for c in chunk),
-                    low=min(c.low for c in chunk),
-                    close=chunk[-1].close,
-                    volume=sum(c.volume for c in chunk)
-                )
-                aggregated.append(agg)
+        n = len(candles)
+        if n == 0:
+            return TimeframeArrays()
         
-        return aggregated
+        starts = np.arange(0, n, period)
+        ends = np.minimum(starts + period, n) - 1
+        return TimeframeArrays(
+            timestamp=candles.timestamp[starts],
+            open=candles.open[starts],
+            high=np.maximum.reduceat(candles.high, starts),
+            low=np.minimum.reduceat(candles.low, starts),
+            close=candles.close[ends],
+            volume=np.add.reduceat(candles.volume, starts)
+        )
     
     async def fetch_prices_parallel(
         self,
@@ -8,13 +8,13 @@ import time
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
-from .types import StrategySignal, MultiTimeframeData
+from .types import StrategySignal, MultiTimeframeData, GeminiValidation
 from .instruments import TRADEABLE_INSTRUMENTS, Instrument
 from .market_hours import filter_tradeable_instruments, get_session_info
 from .data_fetcher import data_fetcher
 from .strategies.base import strategy_registry, InstrumentData
 from .strategies.smc import smc_strategy
-from .validators.gemini import validate_signal
+from .validators.gemini import validate_signals
 from .storage.database import signal_storage
 from .notifications.telegram import send_signal_notification
 from .config import scanner_config
@@ -28,7 +28,7 @@ class SignalScanner:
     Main signal scanner that orchestrates market analysis.
     
     Features:
-    - Parallel data fetching
+    - Parallel data fetching and per-instrument analysis
     - Multi-strategy analysis
     - Gemini AI validation
     - Database persistence
@@ -81,20 +81,31 @@ class SignalScanner:
             all_pending = []
             errors = []
             
-            for instrument in filter_result.tradeable:
-                try:
-                    result = await self._analyze_instrument(instrument)
-                    new_signals.extend(result["signals"])
-                    all_pending.extend(result["pending"])
-                except Exception as e:
-                    logger.error(f"Error analyzing {instrument.symbol}: {e}")
-                    errors.append(f"{instrument.symbol}: {str(e)}")
+            semaphore = asyncio.Semaphore(scanner_config.max_concurrent_analyses)
+            
+            async def analyze_bounded(instrument: Instrument) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._analyze_instrument(instrument)
+            
+            results = await asyncio.gather(
+                *(analyze_bounded(inst) for inst in filter_result.tradeable),
+                return_exceptions=True
+            )
+            
+            for instrument, result in zip(filter_result.tradeable, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error analyzing {instrument.symbol}: {result}")
+                    errors.append(f"{instrument.symbol}: {str(result)}")
+                    continue
+                new_signals.extend(result["signals"])
+                all_pending.extend(result["pending"])
             
             if new_signals:
                 logger.info(f"Generated {len(new_signals)} new trading signals")
                 
-                for signal in new_signals:
-                    await self._save_and_notify_signal(signal)
+                validations = await validate_signals(new_signals)
+                for signal, validation in zip(new_signals, validations):
+                    await self._save_and_notify_signal(signal, validation)
             else:
                 logger.info("No high-confidence signals found in this scan")
             
@@ -163,11 +174,13 @@ class SignalScanner:
             "pending": result.pending_setups
         }
     
-    async def _save_and_notify_signal(self, signal: StrategySignal) -> None:
-        """Validate, save, and notify about a signal."""
+    async def _save_and_notify_signal(
+        self,
+        signal: StrategySignal,
+        validation: Optional[GeminiValidation] = None
+    ) -> None:
+        """Apply Gemini validation, then save and notify about a signal."""
         try:
-            validation = await validate_signal(signal)
-            
             if validation:
                 if validation.recommendation == "skip":
                     logger.info(f"Gemini REJECTED {signal.symbol}: {validation.reasoning}")
@@ -6,8 +6,8 @@ Provides common functionality for analysis and signal generation.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional
+import itertools
 import time
-import uuid
 
 from ..types import (
     StrategyResult, 
@@ -57,6 +57,7 @@ class BaseStrategy(ABC):
         self.max_signals = config.max_signals_per_scan
         self.enabled = config.enabled
         self.logger = get_logger(f"strategy.{config.id}")
+        self._signal_seq = itertools.count()
     
     @abstractmethod
     async def analyze(self, instrument: InstrumentData) -> StrategyResult:
@@ -93,7 +94,7 @@ class BaseStrategy(ABC):
             return False
         
         if data.m1:
-            current_price = data.m1[-1].close
+            current_price = float(data.m1.close[-1])
             zone = setup.entry_zone
             
             is_still_valid = (
@@ -104,13 +105,22 @@ class BaseStrategy(ABC):
         
         return True
     
-    def create_signal_id(self) -> str:
-        """Generate unique signal ID."""
-        return f"{self.id}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+    def create_signal_id(self, now_ms: Optional[int] = None) -> str:
+        """
+        Generate unique signal ID.
+        
+        Pass the scan's ``now_ms`` to avoid a clock read per signal; the
+        per-strategy counter keeps IDs unique within the same millisecond.
+        """
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        return f"{self.id}_{now_ms}_{next(self._signal_seq)}"
     
-    def calculate_expiry_time(self, hours: float = 4.0) -> int:
+    def calculate_expiry_time(self, hours: float = 4.0, now_ms: Optional[int] = None) -> int:
         """Calculate signal expiry timestamp."""
-        return int((time.time() + hours * 3600) * 1000)
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        return now_ms + int(hours * 3_600_000)
     
     def log_analysis(self, message: str, **kwargs) -> None:
         """Log analysis step."""
@@ -5,9 +5,11 @@ Contains all data structures used throughout the application.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional, Literal, Any
+from typing import List, Dict, Optional, Literal, Any, Iterable, Iterator, Union
 from enum import Enum
 
+import numpy as np
+
 
 class SignalDirection(str, Enum):
     BUY = "buy"
@@ -51,7 +53,7 @@ class SwingType(str, Enum):
 Timeframe = Literal["1D", "4H", "2H", "1H", "30M", "15M", "5M", "3M", "1M"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """OHLCV candle data."""
     timestamp: int
@@ -87,14 +89,151 @@ class Candle:
     
     @property
     def body_ratio(self) -> float:
-        if self.total_range == 0:
-            return 0
-        return self.body_size / self.total_range
+        rng = self.high - self.low
+        return abs(self.close - self.open) / rng if rng else 0.0
+    
+    @classmethod
+    def from_arrays(cls, arrays: 'TimeframeArrays', i: int) -> 'Candle':
+        """Materialize candle ``i`` of a TimeframeArrays series."""
+        return cls(
+            timestamp=int(arrays.timestamp[i]),
+            open=float(arrays.open[i]),
+            high=float(arrays.high[i]),
+            low=float(arrays.low[i]),
+            close=float(arrays.close[i]),
+            volume=float(arrays.volume[i])
+        )
+
+
+class TimeframeArrays:
+    """
+    Struct-of-arrays candle series for a single timeframe.
+    
+    Each OHLCV field is a contiguous NumPy column, so scans over a series
+    walk memory sequentially instead of chasing Candle objects. Indexing
+    with an int returns a Candle view and slicing returns another
+    TimeframeArrays, so code written against List[Candle] keeps working.
+    
+    The Candle-derived properties (body_size, total_range, wicks,
+    body_ratio, direction) are computed for the whole series in one
+    vectorized pass on first access and cached alongside the columns.
+    """
+    
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume", "_derived")
+    
+    def __init__(
+        self,
+        timestamp: Optional[np.ndarray] = None,
+        open: Optional[np.ndarray] = None,
+        high: Optional[np.ndarray] = None,
+        low: Optional[np.ndarray] = None,
+        close: Optional[np.ndarray] = None,
+        volume: Optional[np.ndarray] = None
+    ):
+        self.timestamp = np.asarray(timestamp if timestamp is not None else (), dtype=np.int64)
+        self.open = np.asarray(open if open is not None else (), dtype=np.float64)
+        self.high = np.asarray(high if high is not None else (), dtype=np.float64)
+        self.low = np.asarray(low if low is not None else (), dtype=np.float64)
+        self.close = np.asarray(close if close is not None else (), dtype=np.float64)
+        self.volume = (
+            np.asarray(volume, dtype=np.float64)
+            if volume is not None
+            else np.zeros(len(self.timestamp), dtype=np.float64)
+        )
+        self._derived: Optional[Dict[str, np.ndarray]] = None
+    
+    @classmethod
+    def from_candles(cls, candles: Iterable[Candle]) -> 'TimeframeArrays':
+        """Pack a sequence of Candle objects into columns."""
+        candles = list(candles)
+        n = len(candles)
+        return cls(
+            timestamp=np.fromiter((c.timestamp for c in candles), dtype=np.int64, count=n),
+            open=np.fromiter((c.open for c in candles), dtype=np.float64, count=n),
+            high=np.fromiter((c.high for c in candles), dtype=np.float64, count=n),
+            low=np.fromiter((c.low for c in candles), dtype=np.float64, count=n),
+            close=np.fromiter((c.close for c in candles), dtype=np.float64, count=n),
+            volume=np.fromiter((c.volume for c in candles), dtype=np.float64, count=n)
+        )
+    
+    def _compute_derived(self) -> Dict[str, np.ndarray]:
+        """Compute every derived column in one pass over the OHLC data."""
+        if self._derived is None:
+            body_top = np.maximum(self.open, self.close)
+            body_bottom = np.minimum(self.open, self.close)
+            body = body_top - body_bottom
+            rng = self.high - self.low
+            self._derived = {
+                "body_size": body,
+                "total_range": rng,
+                "upper_wick": self.high - body_top,
+                "lower_wick": body_bottom - self.low,
+                "body_ratio": np.divide(body, rng, out=np.zeros_like(body), where=rng != 0),
+                "is_bullish": self.close > self.open,
+                "is_bearish": self.close < self.open,
+            }
+        return self._derived
+    
+    @property
+    def body_size(self) -> np.ndarray:
+        return self._compute_derived()["body_size"]
+    
+    @property
+    def total_range(self) -> np.ndarray:
+        return self._compute_derived()["total_range"]
+    
+    @property
+    def upper_wick(self) -> np.ndarray:
+        return self._compute_derived()["upper_wick"]
+    
+    @property
+    def lower_wick(self) -> np.ndarray:
+        return self._compute_derived()["lower_wick"]
+    
+    @property
+    def body_ratio(self) -> np.ndarray:
+        return self._compute_derived()["body_ratio"]
+    
+    @property
+    def is_bullish(self) -> np.ndarray:
+        return self._compute_derived()["is_bullish"]
+    
+    @property
+    def is_bearish(self) -> np.ndarray:
+        return self._compute_derived()["is_bearish"]
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    def __bool__(self) -> bool:
+        return len(self.timestamp) > 0
+    
+    def __getitem__(self, key: Union[int, slice]) -> Union[Candle, 'TimeframeArrays']:
+        if isinstance(key, slice):
+            sliced = TimeframeArrays(
+                timestamp=self.timestamp[key],
+                open=self.open[key],
+                high=self.high[key],
+                low=self.low[key],
+                close=self.close[key],
+                volume=self.volume[key]
+            )
+            if self._derived is not None:
+                sliced._derived = {name: col[key] for name, col in self._derived.items()}
+            return sliced
+        return Candle.from_arrays(self, key)
+    
+    def __iter__(self) -> Iterator[Candle]:
+        for i in range(len(self)):
+            yield Candle.from_arrays(self, i)
+    
+    def __repr__(self) -> str:
+        return f"TimeframeArrays(n={len(self)})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Zone:
-    """Supply or demand zone."""
+    """Supply or demand zone. Immutable; use dataclasses.replace to update."""
     top_price: float
     bottom_price: float
     type: ZoneType
@@ -103,14 +242,13 @@ class Zone:
     touches: int = 0
     mitigated: bool = False
     created_at: int = 0  # Timestamp for freshness decay
+    # Derived from the bounds once; the zone is frozen, so they cannot go stale.
+    mid_price: float = field(init=False, repr=False, compare=False)
+    zone_size: float = field(init=False, repr=False, compare=False)
     
-    @property
-    def mid_price(self) -> float:
-        return (self.top_price + self.bottom_price) / 2
-    
-    @property
-    def zone_size(self) -> float:
-        return self.top_price - self.bottom_price
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "mid_price", (self.top_price + self.bottom_price) / 2)
+        object.__setattr__(self, "zone_size", self.top_price - self.bottom_price)
     
     def price_in_zone(self, price: float) -> bool:
         return self.bottom_price <= price <= self.top_price
@@ -136,7 +274,7 @@ class Zone:
         return 1.0 - (age / max_age_hours)
 
 
-@dataclass
+@dataclass(slots=True)
 class SwingPoint:
     """Swing high or low point with classification."""
     price: float
@@ -150,15 +288,15 @@ class SwingPoint:
 @dataclass 
 class MultiTimeframeData:
     """Candle data across all timeframes."""
-    d1: List[Candle] = field(default_factory=list)
-    h4: List[Candle] = field(default_factory=list)
-    h2: List[Candle] = field(default_factory=list)
-    h1: List[Candle] = field(default_factory=list)
-    m30: List[Candle] = field(default_factory=list)
-    m15: List[Candle] = field(default_factory=list)
-    m5: List[Candle] = field(default_factory=list)
-    m3: List[Candle] = field(default_factory=list)
-    m1: List[Candle] = field(default_factory=list)
+    d1: TimeframeArrays = field(default_factory=TimeframeArrays)
+    h4: TimeframeArrays = field(default_factory=TimeframeArrays)
+    h2: TimeframeArrays = field(default_factory=TimeframeArrays)
+    h1: TimeframeArrays = field(default_factory=TimeframeArrays)
+    m30: TimeframeArrays = field(default_factory=TimeframeArrays)
+    m15: TimeframeArrays = field(default_factory=TimeframeArrays)
+    m5: TimeframeArrays = field(default_factory=TimeframeArrays)
+    m3: TimeframeArrays = field(default_factory=TimeframeArrays)
+    m1: TimeframeArrays = field(default_factory=TimeframeArrays)
 
 
 @dataclass
@@ -176,7 +314,7 @@ class TimeframeSelection:
     reasoning: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EntrySetup:
     """Entry setup details."""
     direction: SignalDirection
@@ -256,7 +394,7 @@ class GeminiValidation:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceResult:
     """Result from price fetch."""
     price: float
@@ -3,6 +3,6 @@ Signal validators module.
 Contains AI and rule-based validation.
 """
 
-from .gemini import GeminiValidator, validate_signal
+from .gemini import GeminiValidator, validate_signal, validate_signals
 
-__all__ = ["GeminiValidator", "validate_signal"]
+__all__ = ["GeminiValidator", "validate_signal", "validate_signals"]
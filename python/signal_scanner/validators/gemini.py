@@ -4,16 +4,47 @@ Uses Google's Gemini model to validate trading signals.
 """
 
 import json
+import time
 import asyncio
-from typing import Optional, List
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
 from ..types import StrategySignal, GeminiValidation, MultiTimeframeData
 from ..config import gemini_config
 from ..logging_config import get_logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json is a drop-in fallback
+    _json_loads = json.loads
+
 logger = get_logger("gemini_validator")
 
+# Response schema passed to Gemini so the reply is always bare JSON in the
+# shape of GeminiValidation (no prose, no markdown fences).
+VALIDATION_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "validated": {"type": "BOOLEAN"},
+        "confidence_adjustment": {"type": "INTEGER", "minimum": -20, "maximum": 20},
+        "concerns": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "strengths": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "recommendation": {"type": "STRING", "enum": ["proceed", "caution", "skip"]},
+        "reasoning": {"type": "STRING"},
+    },
+    "required": [
+        "validated",
+        "confidence_adjustment",
+        "concerns",
+        "strengths",
+        "recommendation",
+        "reasoning",
+    ],
+}
+
 
 class GeminiValidator:
     """
@@ -30,6 +61,10 @@ class GeminiValidator:
         self.enabled = gemini_config.enabled
         self.model = gemini_config.model
         self._client = None
+        # fingerprint -> (expires_at, validation), oldest first
+        self._cache: "OrderedDict[str, Tuple[float, GeminiValidation]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def _get_client(self):
         """Lazy-initialize the Gemini client."""
@@ -61,6 +96,13 @@ class GeminiValidator:
             logger.info("Gemini validation disabled, skipping")
             return None
         
+        key = self._fingerprint(signal)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        self.cache_misses += 1
+        
         client = self._get_client()
         if not client:
             return None
@@ -68,21 +110,111 @@ class GeminiValidator:
         try:
             prompt = self._build_validation_prompt(signal)
             
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: client.models.generate_content(
-                    model=self.model,
-                    contents=prompt
-                )
+            response = await client.aio.models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config={
+                    "response_mime_type": "application/json",
+                    "response_schema": VALIDATION_SCHEMA,
+                }
             )
             
-            return self._parse_response(response.text)
+            validation = self._parse_response(response.text)
+            if validation is not None:
+                self._cache_put(key, validation)
+            return validation
             
         except Exception as e:
             logger.error(f"Gemini validation failed: {e}")
             return None
     
+    def _fingerprint(self, signal: StrategySignal) -> str:
+        """
+        Content hash of the fields that decide a validation.
+        
+        Adjacent scans re-emit the same setup with the same levels; those
+        hash identically and reuse the earlier verdict.
+        """
+        zone = signal.entry_setup.entry_zone
+        payload = "|".join((
+            signal.symbol,
+            signal.direction.value,
+            f"{signal.entry_price:.5f}",
+            f"{signal.stop_loss:.5f}",
+            f"{signal.take_profit:.5f}",
+            zone.type.value,
+            f"{zone.top_price:.5f}",
+            f"{zone.bottom_price:.5f}",
+            signal.market_context.h4_trend_direction.value,
+        ))
+        return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[GeminiValidation]:
+        """Return a cached validation if present and not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, validation = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return validation
+    
+    def _cache_put(self, key: str, validation: GeminiValidation) -> None:
+        """Store a validation, evicting the least recently used on overflow."""
+        self._cache[key] = (time.monotonic() + gemini_config.cache_ttl_seconds, validation)
+        self._cache.move_to_end(key)
+        while len(self._cache) > gemini_config.cache_size:
+            self._cache.popitem(last=False)
+    
+    def get_cache_stats(self) -> dict:
+        """Get validation cache statistics."""
+        return {
+            "size": len(self._cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
+    
+    async def validate_batch(
+        self,
+        signals: List[StrategySignal]
+    ) -> List[Optional[GeminiValidation]]:
+        """
+        Validate all signals from a scan cycle concurrently.
+        
+        Requests are overlapped up to gemini_config.max_concurrent_requests
+        at a time, so a batch costs roughly one round-trip per wave instead
+        of one per signal. Signals with the same fingerprint share a single
+        request, since none of them would find the others' verdict cached.
+        
+        Args:
+            signals: Signals to validate
+            
+        Returns:
+            One GeminiValidation (or None) per signal, in input order
+        """
+        if not signals:
+            return []
+        
+        keys = [self._fingerprint(s) for s in signals]
+        unique: Dict[str, StrategySignal] = {}
+        for key, signal in zip(keys, signals):
+            unique.setdefault(key, signal)
+        if self.enabled:
+            # Duplicates are answered by the first signal's request
+            self.cache_hits += len(signals) - len(unique)
+        
+        semaphore = asyncio.Semaphore(gemini_config.max_concurrent_requests)
+        
+        async def validate_bounded(signal: StrategySignal) -> Optional[GeminiValidation]:
+            async with semaphore:
+                return await self.validate(signal)
+        
+        results = await asyncio.gather(*(validate_bounded(s) for s in unique.values()))
+        by_key = dict(zip(unique, results))
+        return [by_key[key] for key in keys]
+    
     def _build_validation_prompt(self, signal: StrategySignal) -> str:
         """Build the validation prompt for Gemini."""
         context = signal.market_context
@@ -117,31 +249,16 @@ Zone Type: {setup.entry_zone.type.value}
 3. Verify the zone is valid and unmitigated
 4. Check if entry timing makes sense
 5. Assess if R:R is realistic given market structure
-
-Respond in this exact JSON format:
-{{
-    "validated": true/false,
-    "confidence_adjustment": -20 to +20,
-    "concerns": ["list of concerns if any"],
-    "strengths": ["list of strengths"],
-    "recommendation": "proceed" | "caution" | "skip",
-    "reasoning": "brief explanation"
-}}
-
-Only respond with the JSON, no other text."""
+6. Keep confidence_adjustment between -20 and +20"""
 
         return prompt
     
     def _parse_response(self, response_text: str) -> Optional[GeminiValidation]:
         """Parse Gemini's response into GeminiValidation."""
         try:
-            text = response_text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            
-            data = json.loads(text)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+            # handler below covers both parsers.
+            data = _json_loads(response_text)
             
             return GeminiValidation(
                 validated=data.get("validated", False),
@@ -167,3 +284,10 @@ async def validate_signal(
 ) -> Optional[GeminiValidation]:
     """Convenience function to validate a signal."""
     return await gemini_validator.validate(signal, mtf_data)
+
+
+async def validate_signals(
+    signals: List[StrategySignal]
+) -> List[Optional[GeminiValidation]]:
+    """Convenience function to validate a batch of signals."""
+    return await gemini_validator.validate_batch(signals)
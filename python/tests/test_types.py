@@ -0,0 +1,123 @@
+"""
+Unit tests for the signal scanner data types.
+
+types.py is loaded straight from its file so these tests do not depend on
+the rest of the package (scanner, strategies) importing cleanly.
+"""
+
+import os
+import sys
+import importlib.util
+
+import pytest
+import numpy as np
+
+TYPES_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "signal_scanner", "types.py")
+)
+_spec = importlib.util.spec_from_file_location("signal_scanner_types", TYPES_PATH)
+types = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = types
+_spec.loader.exec_module(types)
+
+Candle = types.Candle
+TimeframeArrays = types.TimeframeArrays
+
+
+class TestTimeframeArrays:
+    """Test struct-of-arrays candle storage."""
+
+    def create_candles(self, count: int) -> list:
+        """Create a simple rising candle series."""
+        return [
+            Candle(i * 60000, 1.0 + i, 1.5 + i, 0.5 + i, 1.2 + i, 100.0)
+            for i in range(count)
+        ]
+
+    def test_from_candles_columns(self):
+        """Each OHLCV field should land in its own typed column."""
+        candles = self.create_candles(3)
+        arrays = TimeframeArrays.from_candles(candles)
+
+        assert arrays.timestamp.dtype == np.int64
+        assert arrays.close.dtype == np.float64
+        assert arrays.timestamp.tolist() == [0, 60000, 120000]
+        assert arrays.open.tolist() == [1.0, 2.0, 3.0]
+        assert arrays.high.tolist() == [1.5, 2.5, 3.5]
+        assert arrays.low.tolist() == [0.5, 1.5, 2.5]
+        assert arrays.close.tolist() == pytest.approx([1.2, 2.2, 3.2])
+        assert arrays.volume.tolist() == [100.0, 100.0, 100.0]
+
+    def test_round_trip(self):
+        """Packing and indexing should reproduce the original candles."""
+        candles = self.create_candles(5)
+        arrays = TimeframeArrays.from_candles(candles)
+
+        assert len(arrays) == 5
+        assert arrays[0] == candles[0]
+        assert arrays[-1] == candles[-1]
+        assert list(arrays) == candles
+
+    def test_int_index_returns_candle(self):
+        """Integer indexing should materialize a plain Candle."""
+        arrays = TimeframeArrays.from_candles(self.create_candles(4))
+
+        candle = arrays[2]
+
+        assert isinstance(candle, Candle)
+        assert candle.timestamp == 2 * 60000
+        assert candle.open == 3.0
+
+    def test_slice_returns_arrays(self):
+        """Slicing should keep the columnar representation."""
+        arrays = TimeframeArrays.from_candles(self.create_candles(10))
+
+        tail = arrays[-3:]
+
+        assert isinstance(tail, TimeframeArrays)
+        assert len(tail) == 3
+        assert tail[0].timestamp == 7 * 60000
+
+    def test_slice_carries_derived_columns(self):
+        """A slice taken after the derived pass should reuse its columns."""
+        arrays = TimeframeArrays.from_candles(self.create_candles(6))
+        full = arrays.body_size
+
+        head = arrays[:2]
+
+        assert head.body_size.tolist() == pytest.approx(full[:2].tolist())
+
+    def test_derived_columns_match_candle(self):
+        """Vectorized columns should equal the per-candle properties."""
+        candles = self.create_candles(5)
+        candles.append(Candle(0, 3.0, 4.0, 1.0, 2.0))
+        arrays = TimeframeArrays.from_candles(candles)
+
+        for i, candle in enumerate(candles):
+            assert arrays.body_size[i] == pytest.approx(candle.body_size)
+            assert arrays.total_range[i] == pytest.approx(candle.total_range)
+            assert arrays.upper_wick[i] == pytest.approx(candle.upper_wick)
+            assert arrays.lower_wick[i] == pytest.approx(candle.lower_wick)
+            assert arrays.body_ratio[i] == pytest.approx(candle.body_ratio)
+            assert arrays.is_bullish[i] == candle.is_bullish
+            assert arrays.is_bearish[i] == candle.is_bearish
+
+    def test_zero_range_candle(self):
+        """A flat candle should get a body ratio of 0 rather than NaN."""
+        flat = Candle(0, 1.0, 1.0, 1.0, 1.0)
+        arrays = TimeframeArrays.from_candles(self.create_candles(2) + [flat])
+
+        with np.errstate(all="raise"):
+            ratio = arrays.body_ratio
+
+        assert arrays.total_range[2] == 0.0
+        assert ratio[2] == 0.0
+        assert ratio[2] == flat.body_ratio
+        assert not np.isnan(ratio).any()
+        assert not arrays.is_bullish[2] and not arrays.is_bearish[2]
+
+    def test_empty_is_falsy(self):
+        """An empty series should behave like an empty list."""
+        assert not TimeframeArrays()
+        assert len(TimeframeArrays()) == 0
+        assert TimeframeArrays.from_candles([]).body_ratio.size == 0
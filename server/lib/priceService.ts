@@ -9,12 +9,17 @@
  *      • yfinance rotating scheduler (forex/stocks/indices/commodities, 6 s/req)
  *    The API layer NEVER triggers an external fetch — it only reads from cache.
  *
- * 2. CANDLE / OHLCV DATA  →  on-demand Python subprocess (price_service.py)
+ * 2. CANDLE / OHLCV DATA  →  price_service.py (also the live-price fallback)
  *    Candle requests are infrequent and require historical aggregation, so they
- *    stay as separate subprocess calls with a 2-minute server-side cache.
+ *    go to price_service.py with a 2-minute server-side cache. Requests use its
+ *    long-running Unix socket server (`--serve`), started on first use; until
+ *    it is listening, or for a cooldown after it dies, they run as one-shot
+ *    subprocesses.
  */
 
-import { spawn } from 'child_process';
+import { spawn, type ChildProcess } from 'child_process';
+import net       from 'net';
+import os        from 'os';
 import path      from 'path';
 import { PYTHON_BIN } from './pythonBin';
 
@@ -102,50 +107,63 @@ export async function getMultiplePrices(
       } satisfies PriceResult;
     });
   } catch (err) {
-    // Daemon unreachable — fall back to price_service.py subprocess per symbol
+    // Daemon unreachable — fall back to one price_service.py subprocess for the
+    // whole batch (it fetches every symbol concurrently)
     console.error('[priceService] Daemon unavailable, falling back to subprocess');
-    return Promise.all(symbols.map(s => getPriceViaSubprocess(s.symbol, s.assetClass)));
+    return getMultiplePricesViaSubprocess(symbols);
   }
 }
 
-/** Fallback: fetch a live price via price_service.py subprocess when daemon is down. */
-export function getPriceViaSubprocess(
+/** Map one price_service.py result onto PriceResult. */
+function fromServiceResult(parsed: any, symbol: string, assetClass: string): PriceResult {
+  return {
+    symbol,
+    assetClass:    parsed.assetClass    ?? assetClass,
+    price:         parsed.price,
+    change:        parsed.change,
+    changePercent: parsed.changePercent,
+    high:          parsed.high,
+    low:           parsed.low,
+    open:          parsed.open,
+    previousClose: parsed.previousClose,
+    volume:        parsed.volume,
+    timestamp:     parsed.timestamp,
+    source:        parsed.source ?? 'subprocess',
+    error:         parsed.error,
+  };
+}
+
+/** Fallback: fetch a batch of live prices with a single price_service.py request. */
+export async function getMultiplePricesViaSubprocess(
+  symbols: Array<{ symbol: string; assetClass: string }>
+): Promise<PriceResult[]> {
+  const fail = (error: string) =>
+    symbols.map(s => ({ symbol: s.symbol, assetClass: s.assetClass, error }));
+
+  try {
+    const parsed = await callPriceService({ action: 'get_multiple_prices', symbols });
+    if (!Array.isArray(parsed)) return fail(parsed?.error ?? 'price_service.py returned no data');
+    return symbols.map((s, i) =>
+      parsed[i]
+        ? fromServiceResult(parsed[i], s.symbol, s.assetClass)
+        : { symbol: s.symbol, assetClass: s.assetClass, error: 'no result' }
+    );
+  } catch (err) {
+    return fail(err instanceof Error ? err.message : String(err));
+  }
+}
+
+/** Fallback: fetch a live price via price_service.py when daemon is down. */
+export async function getPriceViaSubprocess(
   symbol:     string,
   assetClass: string = 'stock'
 ): Promise<PriceResult> {
-  return new Promise((resolve) => {
-    const scriptPath = path.join(process.cwd(), 'server', 'python', 'price_service.py');
-    const req        = JSON.stringify({ action: 'get_price', symbol, assetClass });
-    const proc       = spawn(PYTHON_BIN, [scriptPath, req]);
-
-    let stdout = '';
-    proc.stdout.on('data', (chunk: Buffer) => { stdout += chunk.toString(); });
-    proc.on('error', (err: Error) => resolve({ symbol, assetClass, error: err.message }));
-    proc.on('close', () => {
-      if (stdout.trim()) {
-        try {
-          const parsed = JSON.parse(stdout);
-          resolve({
-            symbol,
-            assetClass:    parsed.assetClass    ?? assetClass,
-            price:         parsed.price,
-            change:        parsed.change,
-            changePercent: parsed.changePercent,
-            high:          parsed.high,
-            low:           parsed.low,
-            open:          parsed.open,
-            previousClose: parsed.previousClose,
-            volume:        parsed.volume,
-            timestamp:     parsed.timestamp,
-            source:        parsed.source ?? 'subprocess',
-            error:         parsed.error,
-          });
-          return;
-        } catch { /* fall through */ }
-      }
-      resolve({ symbol, assetClass, error: 'price_service.py returned no data' });
-    });
-  });
+  try {
+    const parsed = await callPriceService({ action: 'get_price', symbol, assetClass });
+    return fromServiceResult(parsed, symbol, assetClass);
+  } catch (err) {
+    return { symbol, assetClass, error: err instanceof Error ? err.message : String(err) };
+  }
 }
 
 /** Ping — true if the daemon HTTP server is reachable. */
@@ -262,19 +280,101 @@ interface CandleRequest {
   period:     string;
 }
 
+// ── 3. PRICE_SERVICE TRANSPORT ────────────────────────────────────────────────
+
+const SERVICE_SCRIPT = path.join(process.cwd(), 'server', 'python', 'price_service.py');
+// One socket server per Node process, so PM2 workers never share or steal one
+const SERVICE_SOCKET = path.join(os.tmpdir(), `price_service.${process.pid}.sock`);
+const SERVICE_SOCKET_TIMEOUT_MS = 120_000;
+// Connect failures mean no server is listening yet, so the request never ran
+const SERVICE_CONNECT_ERRORS = new Set(['ECONNREFUSED', 'ENOENT']);
+// After the server dies on its own, run one-shot for this long before respawning
+const SERVICE_RESPAWN_COOLDOWN_MS = 30_000;
+
+let serviceServer: ChildProcess | null = null;
+let serviceServerFailedAt = 0;
+
+/** True while a server that died on its own is not to be respawned. */
+function serviceServerCoolingDown(): boolean {
+  return Date.now() - serviceServerFailedAt < SERVICE_RESPAWN_COOLDOWN_MS;
+}
+
+/**
+ * Start `price_service.py --serve` in the background unless it's running.
+ * It holds our stdin pipe and exits when that closes, i.e. when we exit.
+ *
+ * Any other exit is a failure (bad env, import error, crash): it's recorded
+ * so a broken deployment isn't respawned on every call during the cooldown.
+ */
+function ensureServiceServer(): void {
+  if (serviceServer || serviceServerCoolingDown()) return;
+
+  const child = spawn(PYTHON_BIN, [SERVICE_SCRIPT, '--serve', SERVICE_SOCKET], {
+    stdio: ['pipe', 'ignore', 'pipe'],
+  });
+  serviceServer = child;
+  child.stderr?.on('data', (chunk: Buffer) => {
+    console.error(`[priceService] ${chunk.toString().trim()}`);
+  });
+  // restartServiceServer detaches the child before killing it, so a
+  // deliberate kill is not counted as a failure
+  const reset = () => {
+    if (serviceServer !== child) return;
+    serviceServer = null;
+    serviceServerFailedAt = Date.now();
+  };
+  child.on('exit', reset);
+  child.on('error', reset);
+}
+
+/** Kill a hung socket server and start a fresh one in its place. */
+function restartServiceServer(): void {
+  // SIGKILL: a hung server may not act on SIGTERM, and it must not run its
+  // cleanup and unlink the socket the replacement is about to create
+  serviceServer?.kill('SIGKILL');
+  serviceServer = null;
+  ensureServiceServer();
+}
+
+/** Send one request line to the socket server and read one reply line. */
+function requestViaSocket(req: object): Promise<any> {
+  return new Promise((resolve, reject) => {
+    const sock = net.createConnection(SERVICE_SOCKET);
+    let buffer = '';
+
+    sock.setEncoding('utf8');
+    sock.setTimeout(SERVICE_SOCKET_TIMEOUT_MS, () => {
+      sock.destroy(Object.assign(new Error('price_service.py socket timed out'), { code: 'ETIMEDOUT' }));
+    });
+    sock.on('connect', () => sock.write(JSON.stringify(req) + '\n'));
+    sock.on('data', (chunk: string) => {
+      buffer += chunk;
+      const newline = buffer.indexOf('\n');
+      if (newline === -1) return;
+      sock.end();
+      try {
+        resolve(JSON.parse(buffer.slice(0, newline)));
+      } catch (err) {
+        reject(err);
+      }
+    });
+    // Settling twice is a no-op, so close after a reply is harmless
+    sock.on('error', reject);
+    sock.on('close', () => reject(new Error('price_service.py socket closed without a reply')));
+  });
+}
+
 /**
- * Spawns price_service.py to fetch OHLCV candle data.
+ * One-shot price_service.py run with the request in argv[1].
  *
  * Key behaviour: stdout is parsed first regardless of exit code.
  * Python prints a valid JSON payload (possibly with an `error` field) before
  * calling sys.exit(1) on partial failures — so we must attempt JSON.parse
  * before treating the exit code as a hard failure.
  */
-export function callCandleSubprocess(req: CandleRequest): Promise<CandleResult> {
+function spawnPriceService(req: object): Promise<any> {
   return new Promise((resolve, reject) => {
-    const scriptPath = path.join(process.cwd(), 'server', 'python', 'price_service.py');
-    const args       = [scriptPath, JSON.stringify(req)];
-    const proc       = spawn(PYTHON_BIN, args);
+    const proc = spawn(PYTHON_BIN, [SERVICE_SCRIPT, JSON.stringify(req)]);
 
     let stdout = '';
     let stderr = '';
@@ -300,3 +400,32 @@ export function callCandleSubprocess(req: CandleRequest): Promise<CandleResult>
     });
   });
 }
+
+/**
+ * Run one price_service.py request: over the socket server when it's up,
+ * otherwise as a one-shot subprocess while the server starts for next time.
+ *
+ * Only a failed connect falls back to the one-shot run. Once the request
+ * has reached the server, errors are passed to the caller, so a slow batch
+ * is never fetched twice. A timeout also replaces the server, since it is
+ * presumed hung. While a failed server is cooling down, requests go
+ * straight to the one-shot run.
+ */
+export async function callPriceService(req: object): Promise<any> {
+  if (serviceServerCoolingDown()) return spawnPriceService(req);
+  try {
+    return await requestViaSocket(req);
+  } catch (err: any) {
+    if (SERVICE_CONNECT_ERRORS.has(err?.code)) {
+      ensureServiceServer();
+      return spawnPriceService(req);
+    }
+    if (err?.code === 'ETIMEDOUT') restartServiceServer();
+    throw err;
+  }
+}
+
+/** Fetch OHLCV candle data from price_service.py. */
+export function callCandleSubprocess(req: CandleRequest): Promise<CandleResult> {
+  return callPriceService(req);
+}
@@ -7,16 +7,185 @@ Enhanced version with detailed zone annotations and entry confirmations
 import sys
 import json
 import os
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
 import pandas as pd
 import numpy as np
-import mplfinance as mpf
 from datetime import datetime
+
+# Keep matplotlib's font cache next to the script so it is built once (at
+# image build time) instead of rescanning system fonts on a cold start.
+os.environ.setdefault(
+    'MPLCONFIGDIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.mplcache')
+)
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+# Set CHART_DEBUG to include tracebacks in error results
+_DEBUG = bool(os.environ.get('CHART_DEBUG'))
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; stdlib json gives the same output
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Dark theme (formerly an mplfinance 'nightclouds' style rebuilt per chart),
+# applied once so every Axes - including after ax.clear() - starts styled.
+_STYLE_RC = {
+    'figure.facecolor': '#0a0a0f',
+    'savefig.facecolor': '#0a0a0f',
+    'axes.facecolor': '#0a0a0f',
+    'axes.edgecolor': '#1f2937',
+    'axes.labelcolor': '#e5e7eb',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'grid.color': '#1f2937',
+    'grid.linestyle': '-',
+    'grid.linewidth': 0.8,
+    'xtick.color': '#e5e7eb',
+    'ytick.color': '#e5e7eb',
+    'font.size': 9,
+}
+plt.rcParams.update(_STYLE_RC)
+
+# Legend handles are stateless proxies, so one list serves every chart
+_LEGEND_HANDLES = [
+    mpatches.Patch(facecolor='#ef444440', edgecolor='#ef4444', label='Supply Zone'),
+    mpatches.Patch(facecolor='#22c55e40', edgecolor='#22c55e', label='Demand Zone'),
+    Line2D([0], [0], color='#f59e0b', linewidth=2, linestyle='--', label='Stop Loss'),
+    Line2D([0], [0], color='#3b82f6', linewidth=2, linestyle='--', label='Take Profit'),
+]
+
+# Zone (facecolor, linewidth, linestyle) by strength. Fill alpha is 0.35 for
+# strong zones and 0.25 otherwise, pre-baked into the hex colour.
+_SUPPLY_STYLES = {
+    'strong': ('#ef444459', 2, '-'),
+    'moderate': ('#ef44443f', 1, '--'),
+}
+_DEMAND_STYLES = {
+    'strong': ('#22c55e59', 2, '-'),
+    'moderate': ('#22c55e3f', 1, '--'),
+}
+
+# One Figure/Axes per process, cleared between renders instead of rebuilt
+_FIG, _AX = plt.subplots(figsize=(16, 10))
+_FIG.subplots_adjust(bottom=0.25, top=0.92, left=0.08, right=0.85)
+
+# ~1600 px of plot width: beyond this many candles bodies are sub-pixel
+MAX_PLOT_CANDLES = 800
+
+
+def _downsample_ohlc(df: pd.DataFrame, max_candles: int = MAX_PLOT_CANDLES) -> pd.DataFrame:
+    """
+    Merge runs of consecutive candles into OHLC buckets so at most
+    ``max_candles`` are drawn. Unlike plain striding, every bucket keeps its
+    true high and low, so wicks and extremes survive.
+    """
+    n = len(df)
+    if n <= max_candles:
+        return df
+    
+    size = -(-n // max_candles)  # ceil
+    starts = np.arange(0, n, size)
+    ends = np.minimum(starts + size, n) - 1
+    o, h, l, c = df[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float).T
+    return pd.DataFrame(
+        {
+            'Open': o[starts],
+            'High': np.maximum.reduceat(h, starts),
+            'Low': np.minimum.reduceat(l, starts),
+            'Close': c[ends],
+        },
+        index=df.index[starts]
+    )
+
+
+def _zone_masks(zones: list, y_min: float, y_max: float):
+    """
+    Vectorized zone filters.
+    
+    Returns (tops, bottoms, drawable, labelled): ``drawable`` drops zones
+    without positive bounds or lying entirely outside [y_min, y_max],
+    ``labelled`` further requires the zone midpoint to lie inside it.
+    """
+    tops = np.array([float(z.get('top', 0)) for z in zones])
+    bottoms = np.array([float(z.get('bottom', 0)) for z in zones])
+    mids = (tops + bottoms) / 2
+    drawable = (tops > 0) & (bottoms > 0) & (tops >= y_min) & (bottoms <= y_max)
+    labelled = drawable & (mids >= y_min) & (mids <= y_max)
+    return tops, bottoms, drawable, labelled
+
+
+def _zone_verts(tops: np.ndarray, bottoms: np.ndarray, x_min: float, x_max: float) -> np.ndarray:
+    """Full-width zone rectangles as an (M, 4, 2) vertex array."""
+    verts = np.empty((len(tops), 4, 2))
+    verts[:, [0, 3], 0] = x_min
+    verts[:, [1, 2], 0] = x_max
+    verts[:, [0, 1], 1] = bottoms[:, None]
+    verts[:, [2, 3], 1] = tops[:, None]
+    return verts
+
+
+def _draw_zones(
+    ax,
+    zones: list,
+    zone_styles: dict,
+    color: str,
+    default_label: str,
+    x_min: float,
+    x_max: float,
+    y_min: float,
+    y_max: float,
+    show_labels: bool = True
+) -> None:
+    """Draw one side's zones as a single PolyCollection plus their labels."""
+    tops, bottoms, drawable, labelled = _zone_masks(zones, y_min, y_max)
+    if not drawable.any():
+        return
+    
+    styles = [
+        zone_styles.get(zones[i].get('strength', 'moderate'), zone_styles['moderate'])
+        for i in np.flatnonzero(drawable)
+    ]
+    facecolors, linewidths, linestyles = zip(*styles)
+    ax.add_collection(PolyCollection(
+        _zone_verts(tops[drawable], bottoms[drawable], x_min, x_max),
+        facecolors=facecolors,
+        edgecolors=color,
+        linewidths=linewidths,
+        linestyles=list(linestyles),
+        zorder=1
+    ))
+    
+    if not show_labels:
+        return
+    
+    for i in np.flatnonzero(labelled):
+        zone = zones[i]
+        ax.annotate(
+            f"{zone.get('label', default_label)}",
+            xy=(x_min + 0.5, (tops[i] + bottoms[i]) / 2),
+            fontsize=8,
+            color=color,
+            fontweight='bold' if zone.get('strength', 'moderate') == 'strong' else 'normal',
+            va='center',
+            ha='left',
+            zorder=10
+        )
 
-import matplotlib
-matplotlib.use('Agg')
 
 def generate_signal_chart(input_data: dict) -> dict:
     """
@@ -34,6 +203,8 @@ def generate_signal_chart(input_data: dict) -> dict:
             - entry_type: Type of entry (choch, continuation, ds_sd_flip)
             - trend: Market trend direction
             - output_path: Where to save the PNG
+            - detailed: Draw labels, SL/TP fills and the reasoning text
+              (default True); False renders candles, zones and levels only
     
     Returns:
         Dictionary with success status and file path
@@ -49,138 +220,96 @@ def generate_signal_chart(input_data: dict) -> dict:
         entry_type = input_data.get('entry_type', '')
         trend = input_data.get('trend', '')
         output_path = input_data.get('output_path', '/tmp/chart.png')
+        detailed = input_data.get('detailed', True)
         
         if not candles:
             return {"success": False, "error": "No candle data provided"}
         
-        df = pd.DataFrame(candles)
-        df['Date'] = pd.to_datetime(df['date'])
-        df.set_index('Date', inplace=True)
-        df = df.rename(columns={
-            'open': 'Open',
-            'high': 'High', 
-            'low': 'Low',
-            'close': 'Close',
-            'volume': 'Volume'
-        })
-        
-        for col in ['Open', 'High', 'Low', 'Close']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        df = df.dropna(subset=['Open', 'High', 'Low', 'Close'])
+        # One pass over the candle dicts into an (N, 4) float array; missing
+        # values become NaN and are dropped below
+        rows = [(k.get('open'), k.get('high'), k.get('low'), k.get('close')) for k in candles]
+        try:
+            ohlc = np.array(rows, dtype=float)
+        except (TypeError, ValueError):
+            # Non-numeric strings: coerce to NaN like pd.to_numeric(errors='coerce')
+            ohlc = pd.DataFrame(rows).apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        # Node sends ISO 8601 strings (Date.toISOString); a fixed format skips
+        # per-element format inference and yields the index directly
+        dates = pd.to_datetime([k.get('date') for k in candles], format='ISO8601').rename('Date')
+        
+        valid = ~np.isnan(ohlc).any(axis=1)
+        df = pd.DataFrame(
+            ohlc[valid],
+            columns=['Open', 'High', 'Low', 'Close'],
+            index=dates[valid]
+        )
         
         if len(df) < 5:
             return {"success": False, "error": "Not enough candle data"}
         
-        mc = mpf.make_marketcolors(
-            up='#22c55e',
-            down='#ef4444',
-            edge='inherit',
-            wick='inherit',
-            volume='in',
-        )
-        
-        style = mpf.make_mpf_style(
-            base_mpf_style='nightclouds',
-            marketcolors=mc,
-            gridstyle='-',
-            gridcolor='#1f2937',
-            facecolor='#0a0a0f',
-            edgecolor='#1f2937',
-            figcolor='#0a0a0f',
-            rc={
-                'axes.labelcolor': '#e5e7eb',
-                'xtick.color': '#e5e7eb',
-                'ytick.color': '#e5e7eb',
-                'font.size': 9,
-            }
-        )
-        
-        fig, axes = mpf.plot(
-            df,
-            type='candle',
-            style=style,
-            volume=False,
-            returnfig=True,
-            figsize=(16, 10),
-            warn_too_much_data=False,
-            tight_layout=False,
-        )
-        
-        ax = axes[0]
+        df = _downsample_ohlc(df)
+        
+        o, h, l, c = df[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float).T
+        n = len(df)
+        x = np.arange(n, dtype=float)
+        candle_colors = np.where(c >= o, '#22c55e', '#ef4444')
+        
+        fig, ax = _FIG, _AX
+        ax.clear()
+        ax.set_ylabel('Price', color='#e5e7eb', fontsize=9)
+        
+        # Two artists for the whole series instead of one per wick and body:
+        # wicks as (N, 2, 2) low->high segments, bodies as (N, 4, 2) quads.
+        wick_segments = np.empty((n, 2, 2))
+        wick_segments[:, :, 0] = x[:, None]
+        wick_segments[:, 0, 1] = l
+        wick_segments[:, 1, 1] = h
+        ax.add_collection(LineCollection(wick_segments, colors=candle_colors, linewidths=1.0, zorder=2))
+        
+        half_width = 0.35
+        body_low = np.minimum(o, c)
+        body_high = np.maximum(o, c)
+        body_verts = np.empty((n, 4, 2))
+        body_verts[:, 0] = np.column_stack((x - half_width, body_low))
+        body_verts[:, 1] = np.column_stack((x - half_width, body_high))
+        body_verts[:, 2] = np.column_stack((x + half_width, body_high))
+        body_verts[:, 3] = np.column_stack((x + half_width, body_low))
+        ax.add_collection(PolyCollection(
+            body_verts,
+            facecolors=candle_colors,
+            edgecolors=candle_colors,
+            linewidths=0.8,
+            zorder=3
+        ))
+        
+        # y stays on autoscale so zones and signal levels added below widen
+        # the view, as they did with mplfinance
+        ax.set_xlim(-1, n)
+        ax.margins(y=0.05)
+        
+        # x is the candle index (no gaps for closed sessions); label with dates
+        dates = df.index
+        intraday = n > 1 and (dates[-1] - dates[0]) / (n - 1) < pd.Timedelta(days=1)
+        date_fmt = '%b %d %H:%M' if intraday else '%b %d'
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=10, integer=True))
+        ax.xaxis.set_major_formatter(FuncFormatter(
+            lambda val, _pos: dates[int(val)].strftime(date_fmt) if 0 <= val < n else ''
+        ))
         
         y_min, y_max = ax.get_ylim()
         x_min, x_max = ax.get_xlim()
         
-        for zone in supply_zones:
-            top = float(zone.get('top', 0))
-            bottom = float(zone.get('bottom', 0))
-            strength = zone.get('strength', 'moderate')
-            label = zone.get('label', 'Supply')
-            
-            if top > 0 and bottom > 0:
-                alpha = 0.35 if strength == 'strong' else 0.25
-                linewidth = 2 if strength == 'strong' else 1
-                
-                rect = mpatches.Rectangle(
-                    (x_min, bottom),
-                    x_max - x_min,
-                    top - bottom,
-                    linewidth=linewidth,
-                    edgecolor='#ef4444',
-                    facecolor=f'#ef4444{hex(int(alpha * 255))[2:].zfill(2)}',
-                    linestyle='--' if strength != 'strong' else '-',
-                    zorder=1
-                )
-                ax.add_patch(rect)
-                
-                zone_mid = (top + bottom) / 2
-                if y_min <= zone_mid <= y_max:
-                    ax.annotate(
-                        f'{label}',
-                        xy=(x_min + 0.5, zone_mid),
-                        fontsize=8,
-                        color='#ef4444',
-                        fontweight='bold' if strength == 'strong' else 'normal',
-                        va='center',
-                        ha='left',
-                        zorder=10
-                    )
+        # The visible band is the candles plus the signal levels. Zones that
+        # miss it entirely are culled rather than stretching the price axis.
+        if signal:
+            levels = [float(signal.get(k, 0)) for k in ('entry', 'stopLoss', 'takeProfit')]
+            levels = [v for v in levels if v > 0]
+            if levels:
+                y_min = min(y_min, min(levels))
+                y_max = max(y_max, max(levels))
         
-        for zone in demand_zones:
-            top = float(zone.get('top', 0))
-            bottom = float(zone.get('bottom', 0))
-            strength = zone.get('strength', 'moderate')
-            label = zone.get('label', 'Demand')
-            
-            if top > 0 and bottom > 0:
-                alpha = 0.35 if strength == 'strong' else 0.25
-                linewidth = 2 if strength == 'strong' else 1
-                
-                rect = mpatches.Rectangle(
-                    (x_min, bottom),
-                    x_max - x_min,
-                    top - bottom,
-                    linewidth=linewidth,
-                    edgecolor='#22c55e',
-                    facecolor=f'#22c55e{hex(int(alpha * 255))[2:].zfill(2)}',
-                    linestyle='--' if strength != 'strong' else '-',
-                    zorder=1
-                )
-                ax.add_patch(rect)
-                
-                zone_mid = (top + bottom) / 2
-                if y_min <= zone_mid <= y_max:
-                    ax.annotate(
-                        f'{label}',
-                        xy=(x_min + 0.5, zone_mid),
-                        fontsize=8,
-                        color='#22c55e',
-                        fontweight='bold' if strength == 'strong' else 'normal',
-                        va='center',
-                        ha='left',
-                        zorder=10
-                    )
+        _draw_zones(ax, supply_zones, _SUPPLY_STYLES, '#ef4444', 'Supply', x_min, x_max, y_min, y_max, detailed)
+        _draw_zones(ax, demand_zones, _DEMAND_STYLES, '#22c55e', 'Demand', x_min, x_max, y_min, y_max, detailed)
         
         if signal:
             direction = signal.get('direction', '')
@@ -192,7 +321,8 @@ def generate_signal_chart(input_data: dict) -> dict:
             if entry > 0:
                 color = '#22c55e' if direction == 'BUY' else '#ef4444'
                 ax.axhline(y=entry, color=color, linestyle='-', linewidth=2.5, alpha=0.9, zorder=5)
-                
+            
+            if entry > 0 and detailed:
                 entry_label = f' ENTRY: {entry:.5f}'
                 ax.annotate(
                     entry_label,
@@ -208,45 +338,47 @@ def generate_signal_chart(input_data: dict) -> dict:
             
             if sl > 0:
                 ax.axhline(y=sl, color='#f59e0b', linestyle='--', linewidth=2, alpha=0.8, zorder=5)
-                ax.annotate(
-                    f' SL: {sl:.5f}',
-                    xy=(x_max, sl),
-                    fontsize=10,
-                    color='#f59e0b',
-                    fontweight='bold',
-                    va='center',
-                    ha='left',
-                    zorder=10,
-                    bbox=dict(boxstyle='round,pad=0.2', facecolor='#0a0a0f', edgecolor='#f59e0b', alpha=0.8)
-                )
+                if detailed:
+                    ax.annotate(
+                        f' SL: {sl:.5f}',
+                        xy=(x_max, sl),
+                        fontsize=10,
+                        color='#f59e0b',
+                        fontweight='bold',
+                        va='center',
+                        ha='left',
+                        zorder=10,
+                        bbox=dict(boxstyle='round,pad=0.2', facecolor='#0a0a0f', edgecolor='#f59e0b', alpha=0.8)
+                    )
                 
-                if entry > 0:
-                    sl_fill_color = '#f59e0b22'
-                    if direction == 'BUY':
-                        ax.fill_between([x_min, x_max], sl, entry, color=sl_fill_color, alpha=0.3, zorder=0)
-                    else:
-                        ax.fill_between([x_min, x_max], entry, sl, color=sl_fill_color, alpha=0.3, zorder=0)
+                    if entry > 0:
+                        sl_fill_color = '#f59e0b22'
+                        if direction == 'BUY':
+                            ax.fill_between([x_min, x_max], sl, entry, color=sl_fill_color, alpha=0.3, zorder=0)
+                        else:
+                            ax.fill_between([x_min, x_max], entry, sl, color=sl_fill_color, alpha=0.3, zorder=0)
             
             if tp > 0:
                 ax.axhline(y=tp, color='#3b82f6', linestyle='--', linewidth=2, alpha=0.8, zorder=5)
-                ax.annotate(
-                    f' TP: {tp:.5f}',
-                    xy=(x_max, tp),
-                    fontsize=10,
-                    color='#3b82f6',
-                    fontweight='bold',
-                    va='center',
-                    ha='left',
-                    zorder=10,
-                    bbox=dict(boxstyle='round,pad=0.2', facecolor='#0a0a0f', edgecolor='#3b82f6', alpha=0.8)
-                )
+                if detailed:
+                    ax.annotate(
+                        f' TP: {tp:.5f}',
+                        xy=(x_max, tp),
+                        fontsize=10,
+                        color='#3b82f6',
+                        fontweight='bold',
+                        va='center',
+                        ha='left',
+                        zorder=10,
+                        bbox=dict(boxstyle='round,pad=0.2', facecolor='#0a0a0f', edgecolor='#3b82f6', alpha=0.8)
+                    )
                 
-                if entry > 0:
-                    tp_fill_color = '#3b82f622'
-                    if direction == 'BUY':
-                        ax.fill_between([x_min, x_max], entry, tp, color=tp_fill_color, alpha=0.3, zorder=0)
-                    else:
-                        ax.fill_between([x_min, x_max], tp, entry, color=tp_fill_color, alpha=0.3, zorder=0)
+                    if entry > 0:
+                        tp_fill_color = '#3b82f622'
+                        if direction == 'BUY':
+                            ax.fill_between([x_min, x_max], entry, tp, color=tp_fill_color, alpha=0.3, zorder=0)
+                        else:
+                            ax.fill_between([x_min, x_max], tp, entry, color=tp_fill_color, alpha=0.3, zorder=0)
         
         timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')
         direction_text = signal.get('direction', 'SIGNAL') if signal else 'ANALYSIS'
@@ -281,7 +413,7 @@ def generate_signal_chart(input_data: dict) -> dict:
             }.get(entry_type, entry_type.upper())
             info_text_parts.append(f'Entry: {entry_type_display}')
         
-        if info_text_parts:
+        if detailed and info_text_parts:
             info_text = ' | '.join(info_text_parts)
             ax.text(
                 0.01, -0.08,
@@ -294,7 +426,7 @@ def generate_signal_chart(input_data: dict) -> dict:
                 fontweight='bold'
             )
         
-        if confirmations and len(confirmations) > 0:
+        if detailed and confirmations:
             conf_text = 'Confirmations:\n' + '\n'.join([f'  - {c}' for c in confirmations[:5]])
             ax.text(
                 0.01, -0.12,
@@ -307,15 +439,8 @@ def generate_signal_chart(input_data: dict) -> dict:
                 linespacing=1.4
             )
         
-        legend_elements = [
-            mpatches.Patch(facecolor='#ef444440', edgecolor='#ef4444', label='Supply Zone'),
-            mpatches.Patch(facecolor='#22c55e40', edgecolor='#22c55e', label='Demand Zone'),
-            Line2D([0], [0], color='#f59e0b', linewidth=2, linestyle='--', label='Stop Loss'),
-            Line2D([0], [0], color='#3b82f6', linewidth=2, linestyle='--', label='Take Profit'),
-        ]
-        
         ax.legend(
-            handles=legend_elements,
+            handles=_LEGEND_HANDLES,
             loc='upper right',
             fontsize=9,
             facecolor='#1f2937',
@@ -335,36 +460,121 @@ def generate_signal_chart(input_data: dict) -> dict:
             style='italic'
         )
         
-        plt.subplots_adjust(bottom=0.25, top=0.92, left=0.08, right=0.85)
-        
         os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
         
-        fig.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='#0a0a0f', edgecolor='none')
-        plt.close(fig)
+        # Margins are fixed by subplots_adjust, so skip bbox_inches='tight'
+        # (a second full draw) and trade PNG size for a much cheaper zlib pass
+        fig.savefig(output_path, dpi=100, pil_kwargs={'compress_level': 1})
         
         return {"success": True, "path": output_path}
         
     except Exception as e:
-        import traceback
-        return {"success": False, "error": str(e), "traceback": traceback.format_exc()}
+        result = {"success": False, "error": str(e)}
+        if _DEBUG:
+            result["traceback"] = traceback.format_exc()
+        return result
 
 
-def main():
-    """Main entry point - reads JSON from stdin, outputs JSON to stdout"""
+def _batch_workers() -> int:
+    """CHART_WORKERS if it is a valid integer, else the default."""
+    default = min(4, os.cpu_count() or 1)
+    value = os.environ.get('CHART_WORKERS')
+    if not value:
+        return default
     try:
-        input_str = sys.stdin.read()
-        if not input_str.strip():
-            print(json.dumps({"success": False, "error": "No input provided"}))
-            return
-        
-        input_data = json.loads(input_str)
-        result = generate_signal_chart(input_data)
-        print(json.dumps(result))
-        
-    except json.JSONDecodeError as e:
-        print(json.dumps({"success": False, "error": f"Invalid JSON: {e}"}))
+        return int(value)
+    except ValueError:
+        # A bad setting must not take down every render at import
+        print(f"[chart_generator] ignoring non-integer CHART_WORKERS={value!r}", file=sys.stderr)
+        return default
+
+
+# Parallel renders for batch requests. Each pool process owns its own
+# figure, so cap it: CHART_WORKERS overrides the default.
+MAX_BATCH_WORKERS = _batch_workers()
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _warmup() -> None:
+    """Pool initializer: draw and drop a throwaway figure so the Agg backend
+    and font cache are loaded before the first real render."""
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.plot([0, 1], [0, 1])
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _pool_context():
+    """fork where the platform has it, so pool processes inherit this
+    worker's imports instead of re-importing pandas/matplotlib."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _render(input_data: dict) -> dict:
+    """generate_signal_chart that never raises (safe to map over a pool)."""
+    try:
+        return generate_signal_chart(input_data)
     except Exception as e:
-        print(json.dumps({"success": False, "error": str(e)}))
+        return {"success": False, "error": str(e)}
+
+
+def render_batch(requests: list) -> list:
+    """
+    Render several charts at once, one result per request in order.
+    
+    The pool is created on first use and kept for the life of the worker.
+    Pool processes are forked from this already-imported worker where the
+    platform allows it, and _warmup primes matplotlib in each one, so the
+    first batch does not pay the import and font-cache cost.
+    """
+    global _POOL
+    if len(requests) <= 1 or MAX_BATCH_WORKERS <= 1:
+        return [_render(r) for r in requests]
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(
+            max_workers=MAX_BATCH_WORKERS,
+            mp_context=_pool_context(),
+            initializer=_warmup
+        )
+    return list(_POOL.map(_render, requests))
+
+
+def handle_request(line: bytes) -> Union[dict, list]:
+    """Decode one JSON request line and render it (a JSON array is a batch)."""
+    try:
+        input_data = _json_loads(line)
+    except json.JSONDecodeError as e:
+        return {"success": False, "error": f"Invalid JSON: {e}"}
+    if isinstance(input_data, list):
+        return render_batch(input_data)
+    return _render(input_data)
+
+
+def main():
+    """
+    Main entry point - worker loop over newline-delimited JSON.
+    
+    Each stdin line is one request (an object, or an array of objects for a
+    parallel batch) and gets exactly one JSON line back on stdout, so a
+    caller can keep this process alive and skip the interpreter +
+    pandas/matplotlib import cost on every chart. The old one-shot usage
+    (write a single JSON document, close stdin) still works.
+    """
+    # Work on raw bytes: orjson parses them directly, skipping a decode
+    stdout = sys.stdout.buffer
+    handled = False
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        handled = True
+        stdout.write(_json_dumps(handle_request(line)) + b"\n")
+        stdout.flush()
+    
+    if not handled:
+        stdout.write(_json_dumps({"success": False, "error": "No input provided"}) + b"\n")
+        stdout.flush()
 
 
 if __name__ == "__main__":
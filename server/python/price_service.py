@@ -1,27 +1,96 @@
 #!/usr/bin/env python3
 """
-Price Service - Fetches real-time price data using tessa library
+Price Service - Fetches real-time price data over HTTP
 Supports Yahoo Finance (stocks, forex, commodities) and Coingecko (crypto)
 """
 
+import os
+import re
 import sys
 import json
+import stat
+import time
+import atexit
+import asyncio
+import inspect
+import importlib.util
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Awaitable
+from urllib.parse import quote
 
 try:
-    from tessa import Symbol
-    import yfinance as yf
-    from pycoingecko import CoinGeckoAPI
+    import httpx
 except ImportError as e:
     print(json.dumps({"error": f"Missing dependency: {e}"}))
     sys.exit(1)
 
-# Initialize CoinGecko API
-cg = CoinGeckoAPI()
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; stdlib json gives the same output
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Quotes come straight from the REST endpoints; yfinance is only the
+# fallback scrape for symbols the chart endpoint doesn't answer
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{}"
+YAHOO_CHART_PARAMS = {"range": "1d", "interval": "5m"}
+YAHOO_SPARK_URL = "https://query1.finance.yahoo.com/v7/finance/spark"
+YAHOO_BATCH_SIZE = 20  # spark endpoint's per-request symbol limit
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+COINGECKO_MAX_RETRIES = 3       # extra attempts after a 429
+COINGECKO_RETRY_BUDGET = 10.0   # default seconds a lookup may spend waiting out 429s
+HTTP_TIMEOUT = 5.0
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; trading_app/1.0)"}
+
+# HTTP/2 multiplexing needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Default socket for `--serve` mode; requests are one JSON object per line
+SOCKET_PATH = os.environ.get("PRICE_SERVICE_SOCKET", "/tmp/price_service.sock")
+SERVE_LINE_LIMIT = 1 << 20
+
+# ping's shape never changes, so its reply is formatted straight into bytes
+_PING_TEMPLATE = b'{"status":"ok","timestamp":"%s","cache":{"hits":%d,"misses":%d}}'
+# Last line of a get_multiple_prices_stream reply (one that failed part-way
+# ends with {"done": true, "error": ...} instead)
+_STREAM_END = b'{"done":true}'
+
+
+def _cache_ttl() -> float:
+    """PRICE_CACHE_TTL if it is a valid number, else the default."""
+    default = 3.0
+    value = os.environ.get("PRICE_CACHE_TTL")
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        # A bad setting must not take down every call at import
+        print(f"[price_service] ignoring non-numeric PRICE_CACHE_TTL={value!r}", file=sys.stderr)
+        return default
+
+
+# Successful quotes are cached for PRICE_CACHE_TTL seconds, per process and -
+# when REDIS_URL is set - in Redis, so separate invocations share them too
+PRICE_CACHE_TTL = _cache_ttl()
+REDIS_URL = os.environ.get("REDIS_URL")
+
+_price_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_cache_stats = {"hits": 0, "misses": 0}
+_redis = None
+_redis_failed = False
+
+# The maps below are read-only views: nothing may mutate them at runtime,
+# since SYMBOL_TABLE is built from them once at import
 
 # Mapping of common crypto symbols to CoinGecko IDs
-CRYPTO_ID_MAP = {
+CRYPTO_ID_MAP = MappingProxyType({
     "BTC": "bitcoin",
     "ETH": "ethereum",
     "BNB": "binancecoin",
@@ -37,10 +106,11 @@ CRYPTO_ID_MAP = {
     "LINK": "chainlink",
     "UNI": "uniswap",
     "ATOM": "cosmos",
-}
+})
+_CRYPTO_BASE_SET = frozenset(CRYPTO_ID_MAP)
 
 # Forex pairs mapping for Yahoo Finance
-FOREX_MAP = {
+FOREX_MAP = MappingProxyType({
     "EUR/USD": "EURUSD=X",
     "GBP/USD": "GBPUSD=X",
     "USD/JPY": "USDJPY=X",
@@ -69,20 +139,20 @@ FOREX_MAP = {
     "NZD/CAD": "NZDCAD=X",
     "NZD/CHF": "NZDCHF=X",
     "CAD/CHF": "CADCHF=X",
-}
+})
 
 # Commodities mapping for Yahoo Finance
-COMMODITIES_MAP = {
+COMMODITIES_MAP = MappingProxyType({
     "XAU/USD": "GC=F",      # Gold
     "XAG/USD": "SI=F",      # Silver
     "WTI": "CL=F",          # WTI Crude Oil
     "BRENT": "BZ=F",        # Brent Crude Oil
     "NGAS": "NG=F",         # Natural Gas
     "COPPER": "HG=F",       # Copper
-}
+})
 
 # US Indices mapping for Yahoo Finance
-INDEX_MAP = {
+INDEX_MAP = MappingProxyType({
     "US100": "^NDX",        # NASDAQ 100
     "US500": "^GSPC",       # S&P 500
     "US30": "^DJI",         # Dow Jones Industrial Average
@@ -95,17 +165,88 @@ INDEX_MAP = {
     "NASDAQ": "^IXIC",      # NASDAQ Composite
     "SPX": "^GSPC",         # S&P 500 alternative name
     "DJI": "^DJI",          # Dow Jones alternative name
-}
+})
+
+
+def _build_symbol_table() -> "MappingProxyType[Tuple[str, str], Tuple[str, Optional[str]]]":
+    """
+    Fuse the maps above into one lookup: (asset class, upper-cased app
+    symbol) -> (Yahoo ticker, CoinGecko id or None). Crypto bases are
+    entered under every quote spelling the app uses.
+    """
+    table: Dict[Tuple[str, str], Tuple[str, Optional[str]]] = {}
+    for base, coin_id in CRYPTO_ID_MAP.items():
+        for key in (base, f"{base}/USD", f"{base}/USDT", f"{base}-USD"):
+            table[("crypto", key)] = (f"{base}-USD", coin_id)
+    for asset_class, mapping in (("forex", FOREX_MAP), ("commodity", COMMODITIES_MAP), ("stock", INDEX_MAP)):
+        for key, yahoo_symbol in mapping.items():
+            table[(asset_class, key.upper())] = (yahoo_symbol, None)
+    return MappingProxyType(table)
+
+
+SYMBOL_TABLE = _build_symbol_table()
+
+# Symbol normalisation for the fallback rules in resolve_symbol
+_QUOTE_STRIP = re.compile(r"(?:/USDT|[-/]USD)$", re.IGNORECASE)
+_SLASH = str.maketrans("", "", "/")
+
+
+# The HTTP client lives for the whole process so repeated calls reuse warm
+# TCP/TLS connections. It is bound to a persistent event loop (see _run),
+# since its connections cannot outlive the loop they were made on.
+_async_http: Optional["httpx.AsyncClient"] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# yfinance (and the pandas stack behind it) is only needed for the history
+# fallback and candles, so ping and plain quote requests never import it
+_yf = None
+
+
+def _yfinance():
+    """The yfinance module, imported on first use."""
+    global _yf
+    if _yf is None:
+        import yfinance
+        _yf = yfinance
+    return _yf
+
+
+def _async_http_client() -> "httpx.AsyncClient":
+    """Module-wide pooled client that every quote request goes through."""
+    global _async_http
+    if _async_http is None:
+        _async_http = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=HTTP_TIMEOUT,
+            headers=HTTP_HEADERS,
+            limits=HTTP_LIMITS
+        )
+    return _async_http
+
+
+def _run(coro):
+    """Run a coroutine on the module's persistent event loop."""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        atexit.register(_close_loop)
+    return _loop.run_until_complete(coro)
+
 
+def _close_loop() -> None:
+    if _async_http is not None:
+        _loop.run_until_complete(_async_http.aclose())
+    _loop.close()
 
-def get_yahoo_price(symbol: str) -> Optional[Dict[str, Any]]:
+
+def _yahoo_history_price(symbol: str, now_iso: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch price from Yahoo Finance using intraday history.
     Uses 5-min bars for the last 2 days: last bar = current price,
     first bar of today = today's open, first bar of period = prev close.
     """
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = _yfinance().Ticker(symbol)
         # 5-minute bars for last 2 trading days — gives us ~current price
         hist = ticker.history(period="2d", interval="5m")
         if hist.empty:
@@ -137,7 +278,7 @@ def get_yahoo_price(symbol: str) -> Optional[Dict[str, Any]]:
             "open": open_p,
             "previousClose": prev_close,
             "volume": volume,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso or datetime.now().isoformat(),
             "source": "yahoo"
         }
     except Exception:
@@ -145,48 +286,245 @@ def get_yahoo_price(symbol: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def get_coingecko_price(coin_id: str) -> Optional[Dict[str, Any]]:
-    """Fetch price from CoinGecko"""
+def _yahoo_chart_result(
+    symbol: str,
+    chart: Optional[Dict[str, Any]],
+    now_iso: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a price dict from one Yahoo chart result (range=1d, 5m bars), as
+    returned by both the chart and spark endpoints. The meta carries the live
+    price and day range; chartPreviousClose is the prior session's close.
+    Spark results only carry closes, which then stand in for open/high/low.
+    now_iso is the request's timestamp, computed once by the caller.
+    """
     try:
-        data = cg.get_price(
-            ids=coin_id,
-            vs_currencies='usd',
-            include_24hr_change=True,
-            include_24hr_vol=True,
-            include_market_cap=True
-        )
-        
-        if coin_id in data:
-            coin_data = data[coin_id]
-            return {
-                "symbol": coin_id,
-                "price": coin_data.get('usd', 0),
-                "change": 0,  # CoinGecko doesn't provide absolute change
-                "changePercent": coin_data.get('usd_24h_change', 0),
-                "volume": coin_data.get('usd_24h_vol', 0),
-                "marketCap": coin_data.get('usd_market_cap', 0),
-                "timestamp": datetime.now().isoformat(),
-                "source": "coingecko"
-            }
-    except Exception as e:
+        meta = chart["meta"]
+        current_price = float(meta["regularMarketPrice"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+    quotes = (chart.get("indicators") or {}).get("quote") or [{}]
+    bars = quotes[0]
+    opens = [v for v in bars.get("open") or bars.get("close") or [] if v is not None]
+    highs = [v for v in bars.get("high") or bars.get("close") or [] if v is not None]
+    lows = [v for v in bars.get("low") or bars.get("close") or [] if v is not None]
+    volumes = [v for v in bars.get("volume") or [] if v is not None]
+
+    prev_close = float(meta.get("chartPreviousClose") or meta.get("previousClose") or current_price)
+    change = current_price - prev_close
+    change_pct = (change / prev_close * 100) if prev_close else 0
+    return {
+        "symbol": symbol,
+        "price": current_price,
+        "change": change,
+        "changePercent": change_pct,
+        "high": float(meta.get("regularMarketDayHigh") or (max(highs) if highs else current_price)),
+        "low": float(meta.get("regularMarketDayLow") or (min(lows) if lows else current_price)),
+        "open": float(opens[0]) if opens else current_price,
+        "previousClose": prev_close,
+        "volume": int(meta.get("regularMarketVolume") or sum(volumes)),
+        "timestamp": now_iso or datetime.now().isoformat(),
+        "source": "yahoo"
+    }
+
+
+def _yahoo_chart_url(symbol: str) -> str:
+    return YAHOO_CHART_URL.format(quote(symbol, safe=""))
+
+
+def _yahoo_chart_response(
+    symbol: str,
+    response: "httpx.Response",
+    now_iso: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Price dict from a chart endpoint response, or None if it has no quote."""
+    if response.status_code != 200:
+        return None
+    try:
+        chart = (_json_loads(response.content)["chart"]["result"] or [None])[0]
+        return _yahoo_chart_result(symbol, chart, now_iso)
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+async def _fetch_yahoo_spark(
+    client: "httpx.AsyncClient",
+    symbols: List[str],
+    now_iso: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch up to YAHOO_BATCH_SIZE Yahoo prices in one spark request."""
+    try:
+        response = await client.get(YAHOO_SPARK_URL, params={"symbols": ",".join(symbols), **YAHOO_CHART_PARAMS})
+        if response.status_code != 200:
+            return {}
+        results = _json_loads(response.content)["spark"]["result"] or []
+    except (httpx.HTTPError, ValueError, KeyError, TypeError):
+        return {}
+    
+    prices = {}
+    for item in results:
+        symbol = item.get("symbol")
+        price_data = _yahoo_chart_result(symbol, (item.get("response") or [None])[0], now_iso)
+        if symbol and price_data:
+            prices[symbol] = price_data
+    return prices
+
+
+async def _fetch_yahoo_batch(
+    client: "httpx.AsyncClient",
+    symbols: List[str],
+    now_iso: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch Yahoo prices for many symbols, YAHOO_BATCH_SIZE per request, keyed
+    by Yahoo symbol. Symbols missing from the response are simply absent.
+    """
+    unique = list(dict.fromkeys(symbols))
+    chunks = [unique[i:i + YAHOO_BATCH_SIZE] for i in range(0, len(unique), YAHOO_BATCH_SIZE)]
+    prices: Dict[str, Dict[str, Any]] = {}
+    now_iso = now_iso or datetime.now().isoformat()
+    for chunk_prices in await asyncio.gather(*(_fetch_yahoo_spark(client, chunk, now_iso) for chunk in chunks)):
+        prices.update(chunk_prices)
+    return prices
+
+
+async def _fetch_yahoo(
+    client: "httpx.AsyncClient",
+    symbol: str,
+    batch: Optional[Dict[str, Dict[str, Any]]] = None,
+    now_iso: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch price for one Yahoo symbol: from the prefetched batch when it's
+    there, else the chart endpoint, else yfinance.
+    """
+    if batch and symbol in batch:
+        return batch[symbol]
+    now_iso = now_iso or datetime.now().isoformat()
+    try:
+        response = await client.get(_yahoo_chart_url(symbol), params=YAHOO_CHART_PARAMS)
+        price_data = _yahoo_chart_response(symbol, response, now_iso)
+        if price_data:
+            return price_data
+    except httpx.HTTPError:
         pass
-    return None
+    # Endpoint refused or returned nothing: yfinance's history scrape handles
+    # cookies/crumbs, so try it before giving up (blocking, so off the loop)
+    return await asyncio.to_thread(_yahoo_history_price, symbol, now_iso)
 
 
-def symbol_to_yf(symbol: str, asset_class: str) -> str:
-    """Convert an app symbol to its Yahoo Finance ticker string."""
+def _retry_after(response: "httpx.Response", attempt: int) -> float:
+    """Seconds to wait before retrying a 429: Retry-After if given, else backoff."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return float(min(60, 2 ** attempt))
+
+
+async def _fetch_coingecko_batch(
+    client: "httpx.AsyncClient",
+    coin_ids: List[str],
+    deadline: Optional[float] = None,
+    now_iso: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch CoinGecko prices for many coins in one /simple/price call, keyed by
+    coin id. Ids missing from the response are simply absent. Rate limiting
+    (429) is retried as the server asks, but never past deadline
+    (time.monotonic(); default COINGECKO_RETRY_BUDGET seconds from now).
+    """
+    unique = list(dict.fromkeys(coin_ids))
+    if not unique:
+        return {}
+    if deadline is None:
+        deadline = time.monotonic() + COINGECKO_RETRY_BUDGET
+    params = {
+        "ids": ",".join(unique),
+        "vs_currencies": "usd",
+        "include_24hr_change": "true",
+        "include_24hr_vol": "true",
+        "include_market_cap": "true",
+    }
+    try:
+        for attempt in range(COINGECKO_MAX_RETRIES + 1):
+            response = await client.get(COINGECKO_PRICE_URL, params=params)
+            if response.status_code != 429 or attempt == COINGECKO_MAX_RETRIES:
+                break
+            delay = _retry_after(response, attempt)
+            if time.monotonic() + delay > deadline:
+                print(f"[price_service] CoinGecko 429, retry in {delay:g}s would pass the deadline; giving up",
+                      file=sys.stderr)
+                return {}
+            print(f"[price_service] CoinGecko 429, retrying in {delay:g}s ({attempt + 1}/{COINGECKO_MAX_RETRIES})",
+                  file=sys.stderr)
+            await asyncio.sleep(delay)
+        if response.status_code != 200:
+            return {}
+        data = _json_loads(response.content)
+    except (httpx.HTTPError, ValueError):
+        return {}
+    
+    now = now_iso or datetime.now().isoformat()
+    return {
+        coin_id: {
+            "symbol": coin_id,
+            "price": coin_data.get('usd', 0),
+            "change": 0,  # CoinGecko doesn't provide absolute change
+            "changePercent": coin_data.get('usd_24h_change', 0),
+            "volume": coin_data.get('usd_24h_vol', 0),
+            "marketCap": coin_data.get('usd_market_cap', 0),
+            "timestamp": now,
+            "source": "coingecko"
+        }
+        for coin_id, coin_data in data.items()
+        if coin_id in unique and isinstance(coin_data, dict)
+    }
+
+
+def _upper(symbol: str) -> str:
+    """Upper-case symbol, skipping the copy for the usual already-upper case."""
+    return symbol if symbol.isupper() else symbol.upper()
+
+
+def _crypto_base(symbol: str) -> str:
+    """Strip the quote currency from a crypto symbol: "BTC/USDT" -> "BTC"."""
+    return _QUOTE_STRIP.sub("", _upper(symbol))
+
+
+def _coingecko_id(base_symbol: str) -> str:
+    """CoinGecko id for a crypto base symbol."""
+    if base_symbol in _CRYPTO_BASE_SET:
+        return CRYPTO_ID_MAP[base_symbol]
+    return base_symbol.lower()
+
+
+def resolve_symbol(symbol: str, asset_class: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Resolve an app symbol to (Yahoo ticker, CoinGecko id or None): one
+    SYMBOL_TABLE lookup, then the per-class rule for symbols not in the maps.
+    Returns None for an unknown commodity.
+    """
+    if asset_class not in ("crypto", "forex", "commodity"):
+        asset_class = "stock"
+    symbol_u = _upper(symbol)
+    resolved = SYMBOL_TABLE.get((asset_class, symbol_u))
+    if resolved:
+        return resolved
     if asset_class == "crypto":
-        base = symbol.replace("/USDT", "").replace("/USD", "").replace("-USD", "").upper()
-        return f"{base}-USD"
+        base_symbol = _crypto_base(symbol_u)
+        return f"{base_symbol}-USD", _coingecko_id(base_symbol)
     elif asset_class == "forex":
-        yf_sym = FOREX_MAP.get(symbol)
-        if yf_sym:
-            return yf_sym
-        return symbol.replace("/", "") + "=X"
+        return symbol.translate(_SLASH) + "=X", None
     elif asset_class == "commodity":
-        return COMMODITIES_MAP.get(symbol, symbol)
-    else:  # stock / index
-        return INDEX_MAP.get(symbol.upper(), symbol)
+        return None
+    return symbol, None
+
+
+def symbol_to_yf(symbol: str, asset_class: str) -> str:
+    """Convert an app symbol to its Yahoo Finance ticker string."""
+    resolved = resolve_symbol(symbol, asset_class)
+    return resolved[0] if resolved else symbol
 
 
 def get_price(symbol: str, asset_class: str = "stock") -> Dict[str, Any]:
@@ -200,69 +538,138 @@ def get_price(symbol: str, asset_class: str = "stock") -> Dict[str, Any]:
     Returns:
         Price data dictionary
     """
+    return _get_prices([{"symbol": symbol, "assetClass": asset_class}])[0]
+
+
+def _redis_client():
+    """Redis connection for the shared cache tier, or None if unset/unreachable."""
+    global _redis, _redis_failed
+    if _redis is None and REDIS_URL and not _redis_failed:
+        try:
+            import redis
+            _redis = redis.Redis.from_url(REDIS_URL, socket_timeout=0.25, socket_connect_timeout=0.25)
+            _redis.ping()
+        except Exception:
+            # Don't retry every call; the in-process tier still works
+            _redis = None
+            _redis_failed = True
+    return _redis
+
+
+def _redis_key(key: Tuple[str, str]) -> str:
+    return f"price_service:{key[1]}:{key[0]}"
+
+
+def _cache_get_many(keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Look keys up in the in-process cache, then Redis; returns the hits."""
+    now = time.monotonic()
+    hits: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    remote: List[Tuple[str, str]] = []
+    for key in keys:
+        entry = _price_cache.get(key)
+        if entry and now < entry[0]:
+            hits[key] = entry[1]
+        else:
+            remote.append(key)
+    
+    client = _redis_client() if remote else None
+    if client is not None:
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key in remote:
+                pipe.get(_redis_key(key))
+                pipe.pttl(_redis_key(key))
+            replies = pipe.execute()
+            for key, raw, ttl_ms in zip(remote, replies[::2], replies[1::2]):
+                if raw:
+                    hits[key] = _json_loads(raw)
+                    # Keep only the time the entry has left in Redis, so a
+                    # quote is never served older than PRICE_CACHE_TTL
+                    if ttl_ms and ttl_ms > 0:
+                        _price_cache[key] = (now + ttl_ms / 1000, hits[key])
+        except Exception:
+            pass
+    return hits
+
+
+def _cache_put_many(entries: Dict[Tuple[str, str], Dict[str, Any]]) -> None:
+    """Store fresh results in both cache tiers."""
+    expiry = time.monotonic() + PRICE_CACHE_TTL
+    for key, result in entries.items():
+        _price_cache[key] = (expiry, result)
+    
+    client = _redis_client() if entries else None
+    if client is not None:
+        try:
+            ttl_ms = max(1, int(PRICE_CACHE_TTL * 1000))
+            pipe = client.pipeline(transaction=False)
+            for key, result in entries.items():
+                pipe.set(_redis_key(key), _json_dumps(result), px=ttl_ms)
+            pipe.execute()
+        except Exception:
+            pass
+
+
+def _get_prices(symbols: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    return _run(_get_prices_async(symbols))
+
+
+async def _get_prices_async(symbols: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Cached front for _fetch_prices: serve fresh cache hits, fetch the rest
+    in one concurrent pass and cache whatever came back without an error.
+    """
+    keys = [(item.get('symbol', ''), item.get('assetClass', 'stock')) for item in symbols]
+    unique_keys = list(dict.fromkeys(keys))
+    results = _cache_get_many(unique_keys) if PRICE_CACHE_TTL > 0 else {}
+    
+    missing = [key for key in unique_keys if key not in results]
+    _cache_stats["hits"] += len(unique_keys) - len(missing)
+    _cache_stats["misses"] += len(missing)
+    if missing:
+        fetched = await _fetch_prices([{"symbol": k[0], "assetClass": k[1]} for k in missing])
+        results.update(zip(missing, fetched))
+        if PRICE_CACHE_TTL > 0:
+            _cache_put_many({k: r for k, r in zip(missing, fetched) if not r.get("error")})
+    return [results[key] for key in keys]
+
+
+async def _fetch_price(
+    client: "httpx.AsyncClient",
+    symbol: str,
+    asset_class: str,
+    yahoo_batch: Dict[str, Dict[str, Any]],
+    coingecko_batch: Dict[str, Dict[str, Any]],
+    now_iso: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Async body of get_price. yahoo_batch and coingecko_batch hold prices
+    already fetched in bulk, keyed by Yahoo symbol and CoinGecko id.
+    """
     result = {"symbol": symbol, "assetClass": asset_class, "error": None}
     
     try:
-        if asset_class == "crypto":
-            # Use yfinance directly (BTC-USD, ETH-USD, etc.) — faster and more reliable
-            base_symbol = symbol.replace("/USDT", "").replace("/USD", "").replace("-USD", "").upper()
-            yahoo_symbol = f"{base_symbol}-USD"
-            price_data = get_yahoo_price(yahoo_symbol)
-            if price_data:
-                result.update(price_data)
-                result["symbol"] = symbol
-            else:
-                # Fallback to CoinGecko
-                coin_id = CRYPTO_ID_MAP.get(base_symbol, base_symbol.lower())
-                price_data = get_coingecko_price(coin_id)
-                if price_data:
-                    result.update(price_data)
-                    result["symbol"] = symbol
-                else:
-                    result["error"] = f"Could not fetch crypto price for {symbol}"
-                    
-        elif asset_class == "forex":
-            # Handle forex pairs
-            yahoo_symbol = FOREX_MAP.get(symbol)
-            if yahoo_symbol:
-                price_data = get_yahoo_price(yahoo_symbol)
-                if price_data:
-                    result.update(price_data)
-                    result["symbol"] = symbol
-                else:
-                    result["error"] = f"Could not fetch forex price for {symbol}"
-            else:
-                # Try constructing the Yahoo symbol
-                clean_symbol = symbol.replace("/", "") + "=X"
-                price_data = get_yahoo_price(clean_symbol)
-                if price_data:
-                    result.update(price_data)
-                    result["symbol"] = symbol
-                else:
-                    result["error"] = f"Unknown forex pair: {symbol}"
-                    
-        elif asset_class == "commodity":
-            # Handle commodities
-            yahoo_symbol = COMMODITIES_MAP.get(symbol)
-            if yahoo_symbol:
-                price_data = get_yahoo_price(yahoo_symbol)
-                if price_data:
-                    result.update(price_data)
-                    result["symbol"] = symbol
-                else:
-                    result["error"] = f"Could not fetch commodity price for {symbol}"
-            else:
-                result["error"] = f"Unknown commodity: {symbol}"
-                
-        else:  # stock
-            # Check if it's an index first
-            yahoo_symbol = INDEX_MAP.get(symbol.upper(), symbol)
-            price_data = get_yahoo_price(yahoo_symbol)
-            if price_data:
-                result.update(price_data)
-                result["symbol"] = symbol  # Keep original symbol name
-            else:
-                result["error"] = f"Could not fetch stock price for {symbol}"
+        resolved = resolve_symbol(symbol, asset_class)
+        if resolved is None:
+            result["error"] = f"Unknown commodity: {symbol}"
+            return result
+        yahoo_symbol, coin_id = resolved
+        
+        # Bulk results first (crypto: Yahoo, then CoinGecko); a per-symbol
+        # request is only made for symbols neither batch returned
+        price_data = (
+            yahoo_batch.get(yahoo_symbol)
+            or (coin_id and coingecko_batch.get(coin_id))
+            or await _fetch_yahoo(client, yahoo_symbol, now_iso=now_iso)
+        )
+        if price_data:
+            result.update(price_data)
+            result["symbol"] = symbol  # Keep original symbol name
+        elif asset_class == "forex" and ("forex", _upper(symbol)) not in SYMBOL_TABLE:
+            result["error"] = f"Unknown forex pair: {symbol}"
+        else:
+            kind = asset_class if asset_class in ("crypto", "forex", "commodity") else "stock"
+            result["error"] = f"Could not fetch {kind} price for {symbol}"
                 
     except Exception as e:
         result["error"] = str(e)
@@ -270,6 +677,73 @@ def get_price(symbol: str, asset_class: str = "stock") -> Dict[str, Any]:
     return result
 
 
+async def _stream_prices_async(symbols: List[Dict[str, str]]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming form of _get_prices_async: yield one result per distinct symbol
+    as soon as it is ready (cache hits first, then in completion order).
+    Results carry their symbol and assetClass for the caller to match up.
+    """
+    keys = list(dict.fromkeys(
+        (item.get('symbol', ''), item.get('assetClass', 'stock')) for item in symbols
+    ))
+    hits = _cache_get_many(keys) if PRICE_CACHE_TTL > 0 else {}
+    missing = [key for key in keys if key not in hits]
+    _cache_stats["hits"] += len(hits)
+    _cache_stats["misses"] += len(missing)
+    for result in hits.values():
+        yield result
+    
+    fetched: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    if missing:
+        fetches = await _price_fetches([{"symbol": k[0], "assetClass": k[1]} for k in missing])
+        for next_result in asyncio.as_completed(fetches):
+            result = await next_result
+            if not result.get("error"):
+                fetched[(result["symbol"], result["assetClass"])] = result
+            yield result
+    if fetched and PRICE_CACHE_TTL > 0:
+        _cache_put_many(fetched)
+
+
+async def _fetch_prices(symbols: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Fetch every symbol concurrently over the pooled async client, in order.
+    """
+    return await asyncio.gather(*await _price_fetches(symbols))
+
+
+async def _price_fetches(symbols: List[Dict[str, str]]) -> List[Awaitable[Dict[str, Any]]]:
+    """
+    Prefetch in bulk and return one awaitable result per symbol. Yahoo-routed
+    symbols are prefetched together, then crypto the Yahoo batch missed is
+    prefetched from CoinGecko in one call; only misses cost a request each.
+    Every result of one call shares a single timestamp.
+    """
+    client = _async_http_client()
+    now_iso = datetime.now().isoformat()
+    resolved = [
+        resolve_symbol(item.get('symbol', ''), item.get('assetClass', 'stock'))
+        for item in symbols
+    ]
+    resolved = [r for r in resolved if r]
+    yahoo_batch = await _fetch_yahoo_batch(client, [yahoo_symbol for yahoo_symbol, _ in resolved], now_iso)
+    coingecko_batch = await _fetch_coingecko_batch(client, [
+        coin_id for yahoo_symbol, coin_id in resolved
+        if coin_id and yahoo_symbol not in yahoo_batch
+    ], now_iso=now_iso)
+    return [
+        _fetch_price(
+            client,
+            item.get('symbol', ''),
+            item.get('assetClass', 'stock'),
+            yahoo_batch,
+            coingecko_batch,
+            now_iso
+        )
+        for item in symbols
+    ]
+
+
 def get_candles(symbol: str, asset_class: str = "stock", interval: str = "5m", period: str = "5d") -> Dict[str, Any]:
     """
     Fetch OHLCV candle history for a symbol using yfinance.
@@ -277,18 +751,9 @@ def get_candles(symbol: str, asset_class: str = "stock", interval: str = "5m", p
     Indicators are computed with pandas-ta when available.
     """
     try:
-        # Resolve the Yahoo Finance symbol
-        if asset_class == "crypto":
-            base = symbol.replace("/USDT", "").replace("/USD", "").replace("-USD", "").upper()
-            yf_symbol = f"{base}-USD"
-        elif asset_class == "forex":
-            yf_symbol = FOREX_MAP.get(symbol, symbol.replace("/", "") + "=X")
-        elif asset_class == "commodity":
-            yf_symbol = COMMODITIES_MAP.get(symbol, symbol)
-        else:  # stock / index
-            yf_symbol = INDEX_MAP.get(symbol.upper(), symbol)
-
-        ticker = yf.Ticker(yf_symbol)
+        yf_symbol = symbol_to_yf(symbol, asset_class)
+
+        ticker = _yfinance().Ticker(yf_symbol)
 
         # Fetch extra history so indicators have enough candles to compute
         # (EMA200 needs 200 bars min). We trim back to the requested period after.
@@ -631,105 +1096,153 @@ def get_candles(symbol: str, asset_class: str = "stock", interval: str = "5m", p
 
 def get_multiple_prices(symbols: List[Dict[str, str]]) -> List[Dict[str, Any]]:
     """
-    Get prices for multiple symbols using a single yf.download() call for speed.
-    Falls back to sequential fetching for any symbols that fail.
+    Get prices for multiple symbols. Cache misses are requested concurrently
+    on one shared client, so a batch costs roughly its slowest symbol.
     """
     if not symbols:
         return []
+    return _get_prices(symbols)
+
 
-    # Build yfinance symbol list and reverse map
-    yf_symbols: List[str] = []
-    yf_to_app: Dict[str, Dict[str, str]] = {}  # yf_sym -> {symbol, assetClass}
+async def _dispatch(request: Dict[str, Any]) -> Any:
+    """
+    Run one JSON request (see main) and return its JSON-able result, the
+    already encoded reply (bytes) for ping, or an async iterator of results
+    for get_multiple_prices_stream (see _stream_lines).
+    """
+    action = request.get('action', 'get_price')
+    
+    if action == 'get_price':
+        symbol = request.get('symbol', '')
+        asset_class = request.get('assetClass', 'stock')
+        return (await _get_prices_async([{"symbol": symbol, "assetClass": asset_class}]))[0]
+        
+    elif action == 'get_multiple_prices':
+        symbols = request.get('symbols', [])
+        return await _get_prices_async(symbols) if symbols else []
+        
+    elif action == 'get_multiple_prices_stream':
+        return _stream_prices_async(request.get('symbols', []))
+        
+    elif action == 'get_candles':
+        symbol = request.get('symbol', '')
+        asset_class = request.get('assetClass', 'stock')
+        interval = request.get('interval', '5m')
+        period = request.get('period', '1d')
+        # yfinance + indicator maths block; keep the loop free for other clients
+        return await asyncio.to_thread(get_candles, symbol, asset_class, interval, period)
+
+    elif action == 'ping':
+        return _PING_TEMPLATE % (
+            datetime.now().isoformat().encode(),
+            _cache_stats["hits"],
+            _cache_stats["misses"]
+        )
+        
+    return {"error": f"Unknown action: {action}"}
 
-    for item in symbols:
-        sym = item.get('symbol', '')
-        ac = item.get('assetClass', 'stock')
-        yf_sym = symbol_to_yf(sym, ac)
-        yf_symbols.append(yf_sym)
-        yf_to_app[yf_sym] = {'symbol': sym, 'assetClass': ac}
 
-    # Download all symbols in a single HTTP request
-    prices_by_yf: Dict[str, Dict[str, Any]] = {}
+async def _handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answer newline-delimited JSON requests on one connection, in order."""
     try:
-        import pandas as pd
-        unique_yf = list(dict.fromkeys(yf_symbols))  # preserve order, dedupe
-
-        # Use daily bars for batch — one HTTP call, fast for any number of symbols.
-        # Individual price calls use 5-min bars for more current data.
-        data = yf.download(
-            unique_yf,
-            period="2d",
-            interval="1d",
-            progress=False,
-            threads=True,
-            auto_adjust=True,
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                result = await _dispatch(_json_loads(line))
+                if inspect.isasyncgen(result):
+                    async for out in _stream_lines(result):
+                        writer.write(out + b"\n")
+                        await writer.drain()
+                    continue
+            except json.JSONDecodeError as e:
+                result = {"error": f"Invalid JSON: {e}"}
+            except Exception as e:
+                result = {"error": str(e)}
+            writer.write(_encode(result) + b"\n")
+            await writer.drain()
+    except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _serve(socket_path: str) -> None:
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = await asyncio.start_unix_server(_handle_client, path=socket_path, limit=SERVE_LINE_LIMIT)
+    waiters = [asyncio.ensure_future(server.serve_forever())]
+    
+    # Started by a parent holding our stdin pipe: EOF means it went away,
+    # so stop with it rather than linger as an orphan
+    stdin_mode = os.fstat(sys.stdin.fileno()).st_mode
+    if stat.S_ISFIFO(stdin_mode) or stat.S_ISSOCK(stdin_mode):  # Node pipes are socketpairs
+        stdin = asyncio.StreamReader()
+        await asyncio.get_running_loop().connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(stdin), sys.stdin
         )
+        waiters.append(asyncio.ensure_future(stdin.read()))
+    try:
+        async with server:
+            _, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
 
-        if not data.empty:
-            # yf.download returns MultiIndex columns when >1 ticker, flat when =1
-            is_multi = isinstance(data.columns, pd.MultiIndex)
-
-            for yf_sym in unique_yf:
-                try:
-                    if is_multi:
-                        close_col = data['Close'][yf_sym] if yf_sym in data['Close'].columns else None
-                        high_col  = data['High'][yf_sym]  if yf_sym in data['High'].columns  else None
-                        low_col   = data['Low'][yf_sym]   if yf_sym in data['Low'].columns   else None
-                        open_col  = data['Open'][yf_sym]  if yf_sym in data['Open'].columns  else None
-                        vol_col   = data['Volume'][yf_sym] if yf_sym in data['Volume'].columns else None
-                    else:
-                        close_col = data['Close']
-                        high_col  = data['High']
-                        low_col   = data['Low']
-                        open_col  = data['Open']
-                        vol_col   = data['Volume']
-
-                    if close_col is None or close_col.dropna().empty:
-                        continue
-
-                    closes = close_col.dropna()
-                    current = float(closes.iloc[-1])
-                    # Daily bars: iloc[-2] is the previous trading day's close
-                    prev = float(closes.iloc[-2]) if len(closes) >= 2 else current
-                    change  = current - prev
-                    change_pct = (change / prev * 100) if prev else 0
-
-                    prices_by_yf[yf_sym] = {
-                        "price": current,
-                        "previousClose": prev,
-                        "change": change,
-                        "changePercent": change_pct,
-                        "high":   float(high_col.dropna().iloc[-1]) if high_col is not None and not high_col.dropna().empty else current,
-                        "low":    float(low_col.dropna().iloc[-1])  if low_col  is not None and not low_col.dropna().empty  else current,
-                        "open":   float(open_col.dropna().iloc[-1]) if open_col is not None and not open_col.dropna().empty else current,
-                        "volume": int(vol_col.dropna().sum())       if vol_col  is not None and not vol_col.dropna().empty  else 0,
-                        "timestamp": datetime.now().isoformat(),
-                        "source": "yahoo_batch",
-                    }
-                except Exception:
-                    continue
-    except Exception:
-        pass  # fall through to sequential fallback
-
-    # Build results list in original order
-    results: List[Dict[str, Any]] = []
-    for i, item in enumerate(symbols):
-        sym = item.get('symbol', '')
-        ac  = item.get('assetClass', 'stock')
-        yf_sym = yf_symbols[i]
-        if yf_sym in prices_by_yf:
-            entry = {"symbol": sym, "assetClass": ac, "error": None}
-            entry.update(prices_by_yf[yf_sym])
-            results.append(entry)
-        else:
-            # Sequential fallback for symbols that didn't come through the batch
-            results.append(get_price(sym, ac))
 
-    return results
+def serve(socket_path: str = SOCKET_PATH) -> None:
+    """
+    Long-running mode: answer newline-delimited JSON requests (same shape
+    as main's) on a Unix socket, so callers skip interpreter start-up and
+    imports on every quote and share warm connections and the price cache.
+    """
+    try:
+        _run(_serve(socket_path))
+    except KeyboardInterrupt:
+        pass
+
+
+def _encode(result: Any) -> bytes:
+    return result if isinstance(result, bytes) else _json_dumps(result)
+
+
+def _write_json(obj: Any) -> None:
+    sys.stdout.buffer.write(_encode(obj) + b"\n")
+    sys.stdout.flush()
+
+
+async def _stream_lines(results: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    """Encoded NDJSON lines for a streamed reply, ending with _STREAM_END."""
+    try:
+        async for result in results:
+            yield _encode(result)
+    except Exception as e:
+        yield _json_dumps({"done": True, "error": str(e)})
+    else:
+        yield _STREAM_END
+
+
+async def _write_stream(results: AsyncIterator[Any]) -> None:
+    """Write a streamed reply to stdout, flushing after every line."""
+    async for line in _stream_lines(results):
+        sys.stdout.buffer.write(line + b"\n")
+        sys.stdout.flush()
 
 
 def main():
-    """Main entry point - reads JSON from sys.argv[1] or stdin, outputs JSON to stdout"""
+    """
+    Main entry point - reads JSON from sys.argv[1] or stdin, outputs JSON to stdout.
+    `price_service.py --serve [socket_path]` runs the socket server instead.
+    """
+    if len(sys.argv) > 1 and sys.argv[1] == '--serve':
+        serve(sys.argv[2] if len(sys.argv) > 2 else SOCKET_PATH)
+        return
+    
     try:
         # Prefer command-line argument (Node.js passes JSON as argv[1])
         if len(sys.argv) > 1:
@@ -738,43 +1251,21 @@ def main():
             input_data = sys.stdin.read().strip()
 
         if not input_data:
-            print(json.dumps({"error": "No input provided"}))
+            _write_json({"error": "No input provided"})
             sys.exit(1)
         
-        request = json.loads(input_data)
-        
-        action = request.get('action', 'get_price')
-        
-        if action == 'get_price':
-            symbol = request.get('symbol', '')
-            asset_class = request.get('assetClass', 'stock')
-            result = get_price(symbol, asset_class)
-            print(json.dumps(result))
-            
-        elif action == 'get_multiple_prices':
-            symbols = request.get('symbols', [])
-            results = get_multiple_prices(symbols)
-            print(json.dumps(results))
-            
-        elif action == 'get_candles':
-            symbol = request.get('symbol', '')
-            asset_class = request.get('assetClass', 'stock')
-            interval = request.get('interval', '5m')
-            period = request.get('period', '1d')
-            result = get_candles(symbol, asset_class, interval, period)
-            print(json.dumps(result))
-
-        elif action == 'ping':
-            print(json.dumps({"status": "ok", "timestamp": datetime.now().isoformat()}))
-            
+        request = _json_loads(input_data)
+        result = _run(_dispatch(request))
+        if inspect.isasyncgen(result):
+            _run(_write_stream(result))
         else:
-            print(json.dumps({"error": f"Unknown action: {action}"}))
+            _write_json(result)
             
     except json.JSONDecodeError as e:
-        print(json.dumps({"error": f"Invalid JSON: {e}"}))
+        _write_json({"error": f"Invalid JSON: {e}"})
         sys.exit(1)
     except Exception as e:
-        print(json.dumps({"error": str(e)}))
+        _write_json({"error": str(e)})
         sys.exit(1)
 
 
@@ -0,0 +1,234 @@
+"""
+Unit tests for the chart generator worker.
+"""
+
+import os
+import sys
+import json
+import subprocess
+import multiprocessing
+
+import pytest
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SCRIPT_DIR)
+
+import chart_generator  # noqa: E402
+from chart_generator import (  # noqa: E402
+    _downsample_ohlc,
+    _zone_masks,
+    _zone_verts,
+    generate_signal_chart,
+    handle_request,
+    render_batch,
+)
+
+
+def make_candles(n: int, start: float = 100.0) -> list:
+    """ISO-dated candle dicts in the shape Node sends."""
+    dates = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    return [
+        {
+            "date": d.isoformat(),
+            "open": start + i,
+            "high": start + i + 2,
+            "low": start + i - 1,
+            "close": start + i + 1,
+        }
+        for i, d in enumerate(dates)
+    ]
+
+
+def make_request(tmp_path, name: str = "chart", n: int = 10, **extra) -> dict:
+    return {
+        "symbol": "EUR/USD",
+        "timeframe": "1H",
+        "candles": make_candles(n),
+        "output_path": str(tmp_path / f"{name}.png"),
+        **extra,
+    }
+
+
+class TestDownsample:
+    """Test OHLC bucketing for long series."""
+    
+    def make_df(self, n: int) -> pd.DataFrame:
+        x = np.arange(n, dtype=float)
+        return pd.DataFrame(
+            {"Open": x, "High": x + 10, "Low": x - 10, "Close": x + 1},
+            index=pd.date_range("2024-01-01", periods=n, freq="min")
+        )
+    
+    def test_short_series_untouched(self):
+        """Series at or under the cap should be returned as-is."""
+        df = self.make_df(50)
+        assert _downsample_ohlc(df, max_candles=50) is df
+    
+    def test_buckets_keep_ohlc(self):
+        """Each bucket should keep first open, last close and true extremes."""
+        df = self.make_df(10)
+        df.loc[df.index[4], "High"] = 99.0
+        df.loc[df.index[7], "Low"] = -99.0
+        
+        out = _downsample_ohlc(df, max_candles=3)  # buckets of 4: 4 + 4 + 2
+        
+        assert len(out) == 3
+        assert list(out["Open"]) == [0.0, 4.0, 8.0]
+        assert list(out["Close"]) == [4.0, 8.0, 10.0]
+        assert list(out["High"]) == [13.0, 99.0, 19.0]
+        assert list(out["Low"]) == [-10.0, -99.0, -2.0]
+        assert list(out.index) == [df.index[0], df.index[4], df.index[8]]
+    
+    def test_never_exceeds_cap(self):
+        """Output length should never exceed max_candles."""
+        for n in (801, 1000, 1601, 5000):
+            assert len(_downsample_ohlc(self.make_df(n), max_candles=800)) <= 800
+
+
+class TestZones:
+    """Test zone culling and vertex building."""
+    
+    def test_zone_masks(self):
+        """Off-screen and non-positive zones are culled, off-centre ones unlabelled."""
+        zones = [
+            {"top": 105, "bottom": 103},   # fully visible
+            {"top": 120, "bottom": 115},   # entirely above the view
+            {"top": 0, "bottom": 0},       # no bounds
+            {"top": 116, "bottom": 108},   # straddles y_max, midpoint outside
+            {"top": 91, "bottom": 85},     # straddles y_min, midpoint outside
+        ]
+        tops, bottoms, drawable, labelled = _zone_masks(zones, 90.0, 110.0)
+        
+        assert list(tops) == [105, 120, 0, 116, 91]
+        assert list(bottoms) == [103, 115, 0, 108, 85]
+        assert list(drawable) == [True, False, False, True, True]
+        assert list(labelled) == [True, False, False, False, False]
+    
+    def test_zone_masks_missing_keys(self):
+        """Zones without bounds should not be drawn."""
+        _, _, drawable, labelled = _zone_masks([{}], 0.0, 10.0)
+        assert not drawable.any()
+        assert not labelled.any()
+    
+    def test_zone_verts(self):
+        """Each zone should become a full-width rectangle."""
+        verts = _zone_verts(np.array([2.0, 5.0]), np.array([1.0, 3.0]), -0.5, 9.5)
+        
+        assert verts.shape == (2, 4, 2)
+        assert verts[0].tolist() == [[-0.5, 1.0], [9.5, 1.0], [9.5, 2.0], [-0.5, 2.0]]
+        assert verts[1].tolist() == [[-0.5, 3.0], [9.5, 3.0], [9.5, 5.0], [-0.5, 5.0]]
+
+
+class TestGenerateChart:
+    """Test single chart rendering."""
+    
+    def test_renders_png(self, tmp_path):
+        """A valid request should write a PNG and return its path."""
+        request = make_request(
+            tmp_path,
+            supply_zones=[{"top": 115, "bottom": 113, "strength": "strong"}],
+            demand_zones=[{"top": 101, "bottom": 99}],
+            signal={"direction": "BUY", "entry": 105, "stopLoss": 100, "takeProfit": 115,
+                    "confidence": 80},
+        )
+        result = generate_signal_chart(request)
+        
+        assert result == {"success": True, "path": request["output_path"]}
+        with open(result["path"], "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+    
+    def test_nan_rows_dropped(self, tmp_path):
+        """Candles with missing or non-numeric prices should be skipped."""
+        request = make_request(tmp_path, n=7)
+        request["candles"][1]["high"] = None
+        request["candles"][3]["close"] = "n/a"
+        
+        # 5 usable candles remain, which is enough to draw
+        assert generate_signal_chart(request)["success"]
+        
+        request["candles"][5]["open"] = None
+        result = generate_signal_chart(request)
+        assert result == {"success": False, "error": "Not enough candle data"}
+    
+    def test_no_candles(self, tmp_path):
+        """An empty candle list should fail cleanly."""
+        result = generate_signal_chart(make_request(tmp_path, n=0))
+        assert result == {"success": False, "error": "No candle data provided"}
+
+
+class TestBatchProtocol:
+    """Test the NDJSON request/response protocol."""
+    
+    def test_object_line(self, tmp_path):
+        """An object line should get a single result."""
+        line = json.dumps(make_request(tmp_path)).encode()
+        assert handle_request(line)["success"]
+    
+    def test_array_line_keeps_order(self, tmp_path):
+        """An array line should get one result per request, in order."""
+        requests = [make_request(tmp_path, "a"), make_request(tmp_path, "b", n=2),
+                    make_request(tmp_path, "c")]
+        results = handle_request(json.dumps(requests).encode())
+        
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[0]["path"].endswith("a.png")
+        assert results[2]["path"].endswith("c.png")
+    
+    def test_pooled_batch(self, tmp_path, monkeypatch):
+        """The process pool should return the same ordered results."""
+        monkeypatch.setattr(chart_generator, "MAX_BATCH_WORKERS", 2)
+        monkeypatch.setattr(chart_generator, "_POOL", None)
+        try:
+            results = render_batch([make_request(tmp_path, name) for name in "abc"])
+        finally:
+            if chart_generator._POOL is not None:
+                chart_generator._POOL.shutdown()
+        
+        assert [r["path"] for r in results] == [str(tmp_path / f"{name}.png") for name in "abc"]
+    
+    def test_pool_forks_where_available(self):
+        """Pool processes should inherit this worker's imports, not re-import."""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("platform has no fork start method")
+        assert chart_generator._pool_context().get_start_method() == "fork"
+    
+    def test_invalid_json(self):
+        """A malformed line should get an error result, not raise."""
+        result = handle_request(b"{not json")
+        assert result["success"] is False
+        assert result["error"].startswith("Invalid JSON")
+    
+    def test_worker_loop(self, tmp_path):
+        """The worker should answer each non-blank line with exactly one line."""
+        lines = [
+            json.dumps(make_request(tmp_path, "one")),
+            "",
+            json.dumps([make_request(tmp_path, "two"), make_request(tmp_path, "three")]),
+            "{bad",
+        ]
+        proc = subprocess.run(
+            [sys.executable, os.path.join(SCRIPT_DIR, "chart_generator.py")],
+            input="\n".join(lines) + "\n",
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        replies = [json.loads(line) for line in proc.stdout.splitlines()]
+        
+        assert len(replies) == 3
+        assert replies[0]["path"].endswith("one.png")
+        assert [r["success"] for r in replies[1]] == [True, True]
+        assert replies[2]["success"] is False
+    
+    def test_worker_no_input(self):
+        """Closing stdin without a request should report it."""
+        proc = subprocess.run(
+            [sys.executable, os.path.join(SCRIPT_DIR, "chart_generator.py")],
+            input="",
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert json.loads(proc.stdout) == {"success": False, "error": "No input provided"}
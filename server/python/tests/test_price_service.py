@@ -0,0 +1,272 @@
+"""
+Unit tests for the price service: symbol resolution, request dispatch and
+the CoinGecko rate-limit handling. HTTP is served by an httpx.MockTransport.
+"""
+
+import os
+import sys
+import json
+import time
+import subprocess
+
+import httpx
+import pytest
+
+SCRIPT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SCRIPT_DIR)
+
+import price_service as ps  # noqa: E402
+
+
+def spark_result(symbol: str, price: float = 50.0) -> dict:
+    return {
+        "symbol": symbol,
+        "response": [{
+            "meta": {"regularMarketPrice": price, "chartPreviousClose": 40.0},
+            "indicators": {"quote": [{"close": [41.0, None, price]}]},
+        }],
+    }
+
+
+def quote_handler(request: httpx.Request) -> httpx.Response:
+    """Yahoo spark answers every symbol except ZZZ; chart and CoinGecko 404."""
+    if request.url.path.endswith("/spark"):
+        symbols = request.url.params["symbols"].split(",")
+        return httpx.Response(200, json={
+            "spark": {"result": [spark_result(s) for s in symbols if s != "ZZZ"], "error": None}
+        })
+    return httpx.Response(404)
+
+
+class MockHTTP:
+    """MockTransport handler that logs requests and delegates to ``handler``."""
+    
+    def __init__(self):
+        self.requests = []
+        self.handler = quote_handler
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url)
+        return self.handler(request)
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route the shared async client through a MockHTTP."""
+    mock = MockHTTP()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(mock))
+    monkeypatch.setattr(ps, "_async_http", client)
+    monkeypatch.setattr(ps, "PRICE_CACHE_TTL", 0)
+    # The yfinance scrape would go to the network
+    monkeypatch.setattr(ps, "_yahoo_history_price", lambda symbol, now_iso=None: None)
+    yield mock
+    ps._run(client.aclose())
+
+
+class TestResolveSymbol:
+    """Test app symbol -> (Yahoo ticker, CoinGecko id) resolution."""
+    
+    def test_mapped_symbols(self):
+        assert ps.resolve_symbol("EUR/USD", "forex") == ("EURUSD=X", None)
+        assert ps.resolve_symbol("XAU/USD", "commodity") == ("GC=F", None)
+        assert ps.resolve_symbol("US500", "stock") == ("^GSPC", None)
+    
+    def test_crypto_spellings(self):
+        """Every quote spelling of a known base should resolve the same way."""
+        for symbol in ("BTC", "BTC/USD", "BTC/USDT", "BTC-USD", "btc-usd"):
+            assert ps.resolve_symbol(symbol, "crypto") == ("BTC-USD", "bitcoin")
+    
+    def test_fallback_rules(self):
+        """Symbols outside the maps should follow the per-class rule."""
+        assert ps.resolve_symbol("PEPE/USDT", "crypto") == ("PEPE-USD", "pepe")
+        assert ps.resolve_symbol("SEK/NOK", "forex") == ("SEKNOK=X", None)
+        assert ps.resolve_symbol("AAPL", "stock") == ("AAPL", None)
+        assert ps.resolve_symbol("AAPL", "etf") == ("AAPL", None)
+    
+    def test_unknown_commodity(self):
+        assert ps.resolve_symbol("FOO", "commodity") is None
+    
+    def test_maps_are_read_only(self):
+        with pytest.raises(TypeError):
+            ps.SYMBOL_TABLE[("stock", "X")] = ("X", None)
+
+
+class TestRetryAfter:
+    """Test the 429 back-off delay."""
+    
+    def test_header_seconds(self):
+        response = httpx.Response(429, headers={"Retry-After": "3"})
+        assert ps._retry_after(response, 0) == 3.0
+    
+    def test_negative_header_clamped(self):
+        response = httpx.Response(429, headers={"Retry-After": "-5"})
+        assert ps._retry_after(response, 0) == 0.0
+    
+    def test_backoff_without_header(self):
+        """Missing or HTTP-date headers should fall back to capped backoff."""
+        assert ps._retry_after(httpx.Response(429), 0) == 1.0
+        assert ps._retry_after(httpx.Response(429), 3) == 8.0
+        assert ps._retry_after(httpx.Response(429), 10) == 60.0
+        dated = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert ps._retry_after(dated, 1) == 2.0
+
+
+class TestCoinGeckoRetry:
+    """Test that rate-limited CoinGecko batches are retried."""
+    
+    def test_retries_then_succeeds(self, mock_http):
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"bitcoin": {"usd": 1.0, "usd_24h_change": 2.0}})
+        
+        mock_http.handler = handler
+        prices = ps._run(ps._fetch_coingecko_batch(ps._async_http_client(), ["bitcoin"]))
+        
+        assert len(calls) == 3
+        assert prices["bitcoin"]["price"] == 1.0
+        assert prices["bitcoin"]["source"] == "coingecko"
+    
+    def test_gives_up_at_deadline(self, mock_http):
+        mock_http.handler = lambda request: httpx.Response(
+            429, headers={"Retry-After": "30"}
+        )
+        deadline = time.monotonic() + 1
+        assert ps._run(ps._fetch_coingecko_batch(ps._async_http_client(), ["bitcoin"], deadline)) == {}
+        assert len(mock_http.requests) == 1
+
+
+class FakeRedis:
+    """Just enough of redis.Redis for the cache tier: pipelined GET/PTTL."""
+
+    def __init__(self, entries):
+        # key -> (raw value, remaining ttl in ms)
+        self.entries = entries
+        self.queued = []
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def get(self, key):
+        self.queued.append(self.entries.get(key, (None, -2))[0])
+
+    def pttl(self, key):
+        self.queued.append(self.entries.get(key, (None, -2))[1])
+
+    def execute(self):
+        replies, self.queued = self.queued, []
+        return replies
+
+
+class TestCache:
+    """Test the PRICE_CACHE_TTL setting and the Redis cache tier."""
+
+    def test_bad_ttl_falls_back(self, monkeypatch, capsys):
+        monkeypatch.setenv("PRICE_CACHE_TTL", "soon")
+        assert ps._cache_ttl() == 3.0
+        assert "PRICE_CACHE_TTL" in capsys.readouterr().err
+
+    def test_ttl_from_env(self, monkeypatch):
+        monkeypatch.setenv("PRICE_CACHE_TTL", "2.5")
+        assert ps._cache_ttl() == 2.5
+
+    def test_redis_hit_keeps_remaining_ttl(self, monkeypatch):
+        """A Redis hit may only be cached locally for the time it has left."""
+        quote = {"symbol": "AAPL", "price": 1.0}
+        redis = FakeRedis({
+            ps._redis_key(("AAPL", "stock")): (json.dumps(quote), 500),
+            ps._redis_key(("MSFT", "stock")): (json.dumps(quote), -1),
+        })
+        monkeypatch.setattr(ps, "_redis_client", lambda: redis)
+        monkeypatch.setattr(ps, "_price_cache", {})
+        monkeypatch.setattr(ps, "PRICE_CACHE_TTL", 60)
+
+        start = time.monotonic()
+        hits = ps._cache_get_many([("AAPL", "stock"), ("MSFT", "stock"), ("TSLA", "stock")])
+
+        assert set(hits) == {("AAPL", "stock"), ("MSFT", "stock")}
+        expiry, cached = ps._price_cache[("AAPL", "stock")]
+        assert cached == quote
+        assert start + 0.4 < expiry <= time.monotonic() + 0.5
+        # No expiry in Redis means there is nothing safe to copy
+        assert ("MSFT", "stock") not in ps._price_cache
+
+
+class TestDispatch:
+    """Test the request actions shared by one-shot and socket mode."""
+    
+    def test_ping(self):
+        reply = json.loads(ps._run(ps._dispatch({"action": "ping"})))
+        assert reply["status"] == "ok"
+        assert set(reply["cache"]) == {"hits", "misses"}
+    
+    def test_unknown_action(self):
+        assert ps._run(ps._dispatch({"action": "nope"})) == {"error": "Unknown action: nope"}
+    
+    def test_multiple_prices_one_spark_request(self, mock_http):
+        """A batch should cost one spark request and keep input order."""
+        symbols = [
+            {"symbol": "AAPL", "assetClass": "stock"},
+            {"symbol": "EUR/USD", "assetClass": "forex"},
+            {"symbol": "FOO", "assetClass": "commodity"},
+        ]
+        results = ps._run(ps._dispatch({"action": "get_multiple_prices", "symbols": symbols}))
+        
+        assert [r["symbol"] for r in results] == ["AAPL", "EUR/USD", "FOO"]
+        assert results[0]["price"] == 50.0 and results[0]["error"] is None
+        assert results[1]["changePercent"] == pytest.approx(25.0)
+        assert results[2]["error"] == "Unknown commodity: FOO"
+        assert len(mock_http.requests) == 1
+        # One call shares one timestamp
+        assert results[0]["timestamp"] == results[1]["timestamp"]
+    
+    def test_failed_symbol_reports_error(self, mock_http):
+        result = ps._run(ps._dispatch({"action": "get_price", "symbol": "ZZZ"}))
+        assert result["error"] == "Could not fetch stock price for ZZZ"
+    
+    def test_stream_ends_with_marker(self, mock_http):
+        """A stream should yield each distinct symbol once, then the end marker."""
+        symbols = [{"symbol": "AAPL"}, {"symbol": "ZZZ"}, {"symbol": "AAPL"}]
+        stream = ps._run(ps._dispatch({"action": "get_multiple_prices_stream", "symbols": symbols}))
+        
+        async def collect():
+            return [line async for line in ps._stream_lines(stream)]
+        
+        lines = ps._run(collect())
+        
+        assert lines[-1] == ps._STREAM_END
+        results = [json.loads(line) for line in lines[:-1]]
+        assert sorted(r["symbol"] for r in results) == ["AAPL", "ZZZ"]
+    
+    def test_empty_stream(self):
+        stream = ps._run(ps._dispatch({"action": "get_multiple_prices_stream", "symbols": []}))
+        
+        async def collect():
+            return [line async for line in ps._stream_lines(stream)]
+        
+        assert ps._run(collect()) == [ps._STREAM_END]
+
+
+class TestMain:
+    """Test the one-shot command line entry point."""
+    
+    def run(self, *args):
+        return subprocess.run(
+            [sys.executable, os.path.join(SCRIPT_DIR, "price_service.py"), *args],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    
+    def test_ping(self):
+        proc = self.run('{"action": "ping"}')
+        assert proc.returncode == 0
+        assert json.loads(proc.stdout)["status"] == "ok"
+    
+    def test_invalid_json(self):
+        proc = self.run("{bad")
+        assert proc.returncode == 1
+        assert json.loads(proc.stdout)["error"].startswith("Invalid JSON")
@@ -1,4 +1,4 @@
-import { spawn } from 'child_process';
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
 import * as path from 'path';
 import * as fs from 'fs';
 import { PYTHON_BIN } from '../lib/pythonBin';
@@ -38,6 +38,8 @@ export interface ChartGeneratorInput {
   entry_type?: string;
   trend?: string;
   output_path: string;
+  // false skips labels, SL/TP fills and reasoning text (defaults to true)
+  detailed?: boolean;
 }
 
 export interface ChartGeneratorResult {
@@ -46,7 +48,128 @@ export interface ChartGeneratorResult {
   error?: string;
 }
 
-// Generate chart using Python script
+// ── Persistent Python worker ──────────────────────────────────────────────────
+// chart_generator.py answers one JSON line per request line, so a single
+// long-lived child serves every chart and pandas/matplotlib are imported once
+// instead of per chart. Requests are answered in order, so pending callers are
+// a FIFO queue. The worker is shut down after a quiet period and respawned on
+// demand. A request that takes longer than WORKER_REQUEST_TIMEOUT_MS, counted
+// from when it reaches the front of the queue, is taken to mean the worker is
+// hung. That worker is killed and everything queued on it fails, and the next
+// request spawns a fresh one.
+
+const WORKER_IDLE_MS = 5 * 60 * 1000;
+const WORKER_REQUEST_TIMEOUT_MS = 60 * 1000;
+
+interface ChartWorker {
+  child: ChildProcessWithoutNullStreams;
+  // Resolvers get one parsed response line: a result, or an array for a batch
+  pending: Array<(result: any) => void>;
+  // Deadline for the request at the head of the queue
+  requestTimer: NodeJS.Timeout | null;
+}
+
+let worker: ChartWorker | null = null;
+let idleTimer: NodeJS.Timeout | null = null;
+
+function failPending(w: ChartWorker, error: string): void {
+  if (w.requestTimer) clearTimeout(w.requestTimer);
+  w.requestTimer = null;
+  const waiting = w.pending;
+  w.pending = [];
+  for (const resolve of waiting) {
+    resolve({ success: false, error });
+  }
+}
+
+// (Re)start the deadline for whichever request is now at the head of the queue
+function armRequestTimer(w: ChartWorker): void {
+  if (w.requestTimer) clearTimeout(w.requestTimer);
+  w.requestTimer = null;
+  if (w.pending.length === 0) return;
+
+  w.requestTimer = setTimeout(() => {
+    if (worker === w) worker = null;
+    console.error(`Chart worker timed out after ${WORKER_REQUEST_TIMEOUT_MS}ms; restarting`);
+    failPending(w, `Chart generation timed out after ${WORKER_REQUEST_TIMEOUT_MS / 1000}s`);
+    w.child.kill('SIGKILL');
+  }, WORKER_REQUEST_TIMEOUT_MS);
+}
+
+// Queue a resolver and send its request line to the worker
+function sendRequest(w: ChartWorker, payload: unknown, resolve: (result: any) => void): void {
+  if (idleTimer) clearTimeout(idleTimer);
+  w.pending.push(resolve);
+  if (w.pending.length === 1) armRequestTimer(w);
+
+  // One request per line; JSON.stringify never emits a raw newline
+  w.child.stdin.write(JSON.stringify(payload) + '\n');
+}
+
+function scheduleIdleShutdown(w: ChartWorker): void {
+  if (idleTimer) clearTimeout(idleTimer);
+  idleTimer = setTimeout(() => {
+    if (worker === w && w.pending.length === 0) {
+      worker = null;
+      w.child.stdin.end();
+    }
+  }, WORKER_IDLE_MS);
+  idleTimer.unref();
+}
+
+function getWorker(pythonScript: string): ChartWorker {
+  if (worker) return worker;
+
+  const child = spawn(PYTHON_BIN, [pythonScript]);
+  const w: ChartWorker = { child, pending: [], requestTimer: null };
+  worker = w;
+  let stdoutBuffer = '';
+  let lastStderr = '';
+
+  child.stdout.on('data', (data) => {
+    stdoutBuffer += data.toString();
+    let newline: number;
+    while ((newline = stdoutBuffer.indexOf('\n')) !== -1) {
+      const line = stdoutBuffer.slice(0, newline).trim();
+      stdoutBuffer = stdoutBuffer.slice(newline + 1);
+      if (!line) continue;
+
+      const resolve = w.pending.shift();
+      if (!resolve) continue;
+      armRequestTimer(w);
+      try {
+        resolve(JSON.parse(line));
+      } catch (e) {
+        resolve({ success: false, error: `Failed to parse result: ${line}` });
+      }
+    }
+    if (w.pending.length === 0) scheduleIdleShutdown(w);
+  });
+
+  child.stderr.on('data', (data) => {
+    lastStderr = data.toString();
+  });
+
+  // Writing to a worker that just died raises EPIPE here; 'close' fails the queue
+  child.stdin.on('error', () => {});
+
+  child.on('close', (code) => {
+    if (worker === w) worker = null;
+    if (w.pending.length > 0) {
+      console.error('Chart generation stderr:', lastStderr);
+      failPending(w, lastStderr || `Process exited with code ${code}`);
+    }
+  });
+
+  child.on('error', (err) => {
+    if (worker === w) worker = null;
+    failPending(w, err.message);
+  });
+
+  return w;
+}
+
+// Generate chart using the Python worker
 export async function generateSignalChart(input: ChartGeneratorInput): Promise<ChartGeneratorResult> {
   return new Promise((resolve) => {
     // Use absolute path to ensure script is found regardless of working directory
@@ -58,40 +181,27 @@ export async function generateSignalChart(input: ChartGeneratorInput): Promise<C
       return;
     }
     
-    const python = spawn(PYTHON_BIN, [pythonScript]);
-    let stdout = '';
-    let stderr = '';
-    
-    python.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-    
-    python.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
+    sendRequest(getWorker(pythonScript), input, resolve);
+  });
+}
+
+// Generate several charts in one request; the worker renders them in parallel
+// and results come back in input order
+export async function generateSignalCharts(inputs: ChartGeneratorInput[]): Promise<ChartGeneratorResult[]> {
+  if (inputs.length === 0) return [];
+
+  return new Promise((resolve) => {
+    const pythonScript = path.resolve(process.cwd(), 'server/python/chart_generator.py');
     
-    python.on('close', (code) => {
-      if (code !== 0) {
-        console.error('Chart generation stderr:', stderr);
-        resolve({ success: false, error: stderr || `Process exited with code ${code}` });
-        return;
-      }
-      
-      try {
-        const result = JSON.parse(stdout);
-        resolve(result);
-      } catch (e) {
-        resolve({ success: false, error: `Failed to parse result: ${stdout}` });
-      }
-    });
+    if (!fs.existsSync(pythonScript)) {
+      resolve(inputs.map(() => ({ success: false, error: 'Chart generator script not found' })));
+      return;
+    }
     
-    python.on('error', (err) => {
-      resolve({ success: false, error: err.message });
+    sendRequest(getWorker(pythonScript), inputs, (result: ChartGeneratorResult | ChartGeneratorResult[]) => {
+      // A worker failure fails the whole batch with a single error result
+      resolve(Array.isArray(result) ? result : inputs.map(() => result));
     });
-    
-    // Send input data as JSON
-    python.stdin.write(JSON.stringify(input));
-    python.stdin.end();
   });
 }
 
@@ -7,7 +7,7 @@ import { Candle } from "../strategies/core/types";
 import { getPrice } from "../lib/priceService";
 import { filterTradeableInstruments, getActiveSession } from "../lib/marketHours";
 import { validateSignalWithGemini, SignalToValidate, PriceData } from "./geminiAnalysis";
-import { generateSignalChart, ChartCandle, ZoneInfo } from "./chartGenerator";
+import { generateSignalCharts, ChartCandle, ChartGeneratorInput, ZoneInfo } from "./chartGenerator";
 import * as path from "path";
 import * as fs from "fs";
 
@@ -423,6 +423,9 @@ export class SignalScannerService {
             }
           }
 
+          // Charts are rendered together in one parallel batch
+          const chartJobs: { label: string; input: ChartGeneratorInput }[] = [];
+
           // 1. HTF Context Chart (Daily/H4) - shows trend direction
           const htfData = mtfData.d1 || mtfData.h4;
           if (htfData && htfData.length > 0) {
@@ -431,7 +434,7 @@ export class SignalScannerService {
               open: c.open, high: c.high, low: c.low, close: c.close,
             }));
             const htfPath = path.join('/tmp', `gemini_htf_${signal.symbol.replace('/', '_')}_${Date.now()}.png`);
-            const htfResult = await generateSignalChart({
+            chartJobs.push({ label: 'HTF', input: {
               symbol: signal.symbol,
               timeframe: mtfData.d1 ? '1D' : 'H4',
               candles: htfCandles,
@@ -440,11 +443,7 @@ export class SignalScannerService {
               confirmations: [`HTF Trend: ${extendedCtx?.h4TrendDirection || 'unknown'}`],
               trend: extendedCtx?.h4TrendDirection || 'sideways',
               output_path: htfPath,
-            });
-            if (htfResult.success && htfResult.path) {
-              chartPaths.push(htfResult.path);
-              console.log(`[Gemini] HTF chart generated: ${htfResult.path}`);
-            }
+            } });
           }
 
           // 2. Zone Identification Chart (M15/M30) - shows the zone
@@ -455,7 +454,7 @@ export class SignalScannerService {
               open: c.open, high: c.high, low: c.low, close: c.close,
             }));
             const zonePath = path.join('/tmp', `gemini_zone_${signal.symbol.replace('/', '_')}_${Date.now()}.png`);
-            const zoneResult = await generateSignalChart({
+            chartJobs.push({ label: 'Zone', input: {
               symbol: signal.symbol,
               timeframe: mtfData.m15 ? 'M15' : 'M30',
               candles: zoneCandles,
@@ -464,11 +463,7 @@ export class SignalScannerService {
               confirmations: [`Zone: ${signal.entrySetup?.entryZone?.type || 'unknown'}`],
               trend: extendedCtx?.h4TrendDirection || 'sideways',
               output_path: zonePath,
-            });
-            if (zoneResult.success && zoneResult.path) {
-              chartPaths.push(zoneResult.path);
-              console.log(`[Gemini] Zone chart generated: ${zoneResult.path}`);
-            }
+            } });
           }
 
           // 3. Entry/Refinement Chart (M5/M3/M1) - shows entry trigger
@@ -479,7 +474,7 @@ export class SignalScannerService {
               open: c.open, high: c.high, low: c.low, close: c.close,
             }));
             const entryPath = path.join('/tmp', `gemini_entry_${signal.symbol.replace('/', '_')}_${Date.now()}.png`);
-            const entryResult = await generateSignalChart({
+            chartJobs.push({ label: 'Entry', input: {
               symbol: signal.symbol,
               timeframe: signal.timeframe,
               candles: entryCandles,
@@ -496,12 +491,16 @@ export class SignalScannerService {
               entry_type: signal.entryType,
               trend: extendedCtx?.h4TrendDirection || 'sideways',
               output_path: entryPath,
-            });
-            if (entryResult.success && entryResult.path) {
-              chartPaths.push(entryResult.path);
-              console.log(`[Gemini] Entry chart generated: ${entryResult.path}`);
-            }
+            } });
           }
+
+          const chartResults = await generateSignalCharts(chartJobs.map((job) => job.input));
+          chartResults.forEach((result, i) => {
+            if (result.success && result.path) {
+              chartPaths.push(result.path);
+              console.log(`[Gemini] ${chartJobs[i].label} chart generated: ${result.path}`);
+            }
+          });
         } catch (chartError) {
           console.log(`[Gemini] Chart generation failed, proceeding without images`);
         }